@@ -0,0 +1,103 @@
+"""
+Optional build step that compiles the hottest modules of pydantic-serdes
+ahead-of-time into C extensions, in place, next to their .py counterparts.
+
+It is NOT hooked into the package build, so wheels and sdists of pydantic-serdes
+are always pure python. Instead, it's meant to be run from a source checkout,
+which is then installed in editable mode, for instance:
+
+    pip install Cython setuptools
+    USE_CYTHON=1 python build.py
+    pip install -e .
+
+Alternatively, the data store module can be compiled by mypyc instead, by setting
+the USE_MYPYC environment variable to "1" (USE_CYTHON takes precedence if both are):
+
+    pip install mypy setuptools
+    USE_MYPYC=1 python build.py
+
+The .py files remain the source of truth: Cython and mypyc compile them as they are,
+and python will import the compiled extensions in place of the .py modules. To go
+back to pure python, just delete the compiled extensions (pydantic_serdes/*.so or
+pydantic_serdes/*.pyd).
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+# modules on the hot path of saving and searching for models in the data store
+CYTHON_MODULES = [
+    "pydantic_serdes/datastore.py",
+    "pydantic_serdes/custom_collections.py",
+]
+
+CYTHON_DIRECTIVES = {"language_level": 3, "boundscheck": False}
+
+# mypyc compiles classes into native ones, which can't inherit from python classes
+# (like sortedcontainers.SortedSet) nor from dict, so custom_collections.py is left out.
+MYPYC_MODULES = ["pydantic_serdes/datastore.py"]
+
+# only the modules being compiled must type check; the ones they import are merely
+# used for type inference.
+MYPYC_OPTIONS = ["--follow-imports=silent", "--ignore-missing-imports"]
+
+
+def _use_cython() -> bool:
+    return os.environ.get("USE_CYTHON", "0") == "1"
+
+
+def _use_mypyc() -> bool:
+    return os.environ.get("USE_MYPYC", "0") == "1"
+
+
+def build_cython_extensions() -> None:
+    """
+    Cythonizes CYTHON_MODULES and builds them as C extensions, which are then
+    copied next to their .py counterparts, so they get imported in their place.
+    """
+    # these are only required when opting in for the compilation.
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(CYTHON_MODULES, compiler_directives=CYTHON_DIRECTIVES)
+
+    _build_extensions(ext_modules)
+
+
+def build_mypyc_extensions() -> None:
+    """
+    Compiles MYPYC_MODULES with mypyc and builds them as C extensions, which are
+    then copied next to their .py counterparts, so they get imported in their place.
+    """
+    # these are only required when opting in for the compilation.
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_OPTIONS + MYPYC_MODULES, opt_level="3")
+
+    _build_extensions(ext_modules)
+
+
+def _build_extensions(ext_modules: list) -> None:
+    from setuptools import Distribution
+    from setuptools.command.build_ext import build_ext
+
+    distribution = Distribution({"name": "pydantic_serdes", "ext_modules": ext_modules})
+    cmd = build_ext(distribution)
+    cmd.ensure_finalized()
+    cmd.run()
+
+    for output in cmd.get_outputs():
+        relative_extension = Path(output).relative_to(cmd.build_lib)
+        relative_extension.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, relative_extension)
+
+
+def build() -> None:
+    if _use_cython():
+        build_cython_extensions()
+    elif _use_mypyc():
+        build_mypyc_extensions()
+
+
+if __name__ == "__main__":
+    build()
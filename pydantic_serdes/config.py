@@ -1,8 +1,9 @@
 import importlib
 import inspect
 import os
-from types import ModuleType
-from typing import Dict, List, Type
+from functools import cached_property, lru_cache
+from types import FunctionType, ModuleType
+from typing import Callable, Dict, FrozenSet, List, Type
 
 from pydantic_serdes.exceptions import PydanticSerdesImportError
 
@@ -28,53 +29,76 @@ DUMPERS_MODULE = "pydantic_serdes.dumpers"
 # Example: "my_module1.models,my_module2.models"
 MODELS_MODULES = "pydantic_serdes.models"
 
+# Whether the json loader and dumper should use orjson (if it's installed). It's
+# opt-in, as orjson doesn't behave exactly like the stdlib json module does.
+# Set it to "1" to enable it.
+USE_ORJSON = "0"
+
+
+@lru_cache(maxsize=None)
+def _cached_import(module_path: str) -> ModuleType:
+    """
+    Imports the module found at `module_path` and memoizes it, so that any later
+    request for the same dotted path is a plain dict lookup instead of another
+    trip through the import machinery.
+
+    Raises:
+        PydanticSerdesImportError: If the module cannot be imported.
+    """
+    try:
+        return importlib.import_module(module_path)
+    except ImportError as err:
+        raise PydanticSerdesImportError(err)
+
 
 class PydanticSerdesConfig:
     """
     This class is used to hold the configuration of the package, which is
     determined by the environment variables.
+
+    Environment variables are not expected to change while the process is running.
+    Hence, each config is resolved only once, the first time it's accessed, and the
+    value is then memoized in the instance. If you ever need to have them resolved
+    again (e.g. in tests), call the .reset_cache() method.
     """
 
-    # this attr is initialized as an empty dictionary and will be populated
-    # whenever the self.directive_to_model_mapping property is called by
-    # utils.create_all_models_from_dict function.
+    # this attr is initialized as an empty dictionary and is populated by
+    # PydanticSerdesBaseModel.__pydantic_init_subclass__, as each subclass
+    # with a '_directive' set is created.
     _directive_to_model_mapping: Dict[str, Type] = {}
 
-    @property
+    # whether all modules in self.models_modules have already been imported
+    _models_modules_imported: bool = False
+
+    @cached_property
     def templates_dir(self) -> str:
         return os.environ.get("TEMPLATES_DIR", TEMPLATES_DIR)
 
-    @property
+    @cached_property
     def hashable_dict_cls(self) -> str:
         return os.environ.get("HASHABLE_DICT_CLS", HASHABLE_DICT_CLS)
 
-    @property
+    @cached_property
     def loaders_module_path(self) -> str:
         return os.environ.get("LOADERS_MODULE", LOADERS_MODULE)
 
-    @property
+    @cached_property
     def loaders_module(self) -> ModuleType:
-        try:
-            loaders_module = importlib.import_module(self.loaders_module_path)
-        except ImportError as err:
-            raise PydanticSerdesImportError(err)
-
-        return loaders_module
+        return _cached_import(self.loaders_module_path)
 
-    @property
+    @cached_property
     def dumpers_module_path(self) -> str:
         return os.environ.get("DUMPERS_MODULE", DUMPERS_MODULE)
 
-    @property
+    @cached_property
     def dumpers_module(self) -> ModuleType:
-        try:
-            dumpers_module = importlib.import_module(self.dumpers_module_path)
-        except ImportError as err:
-            raise PydanticSerdesImportError(err)
+        return _cached_import(self.dumpers_module_path)
 
-        return dumpers_module
+    @cached_property
+    def use_orjson(self) -> bool:
+        return os.environ.get("USE_ORJSON", USE_ORJSON) == "1"
 
-    @property
+    @cached_property
     def supported_formats(self) -> List[str]:
         """
         For simplicity, we only take loaders as the basis to determine the supported formats.
@@ -82,45 +106,115 @@ class PydanticSerdesConfig:
         In this package, it's guaranteed to always exist a matching dumper for each loader.
         If you are using a custom loader module, you should also strive for the same.
         """
+        # a plain scan over the module namespace is enough here: there's no need
+        # for inspect.getmembers() to sort and materialize every module attribute.
         supported_formats = [
             name.partition("_")[0]
-            for name, obj in inspect.getmembers(self.loaders_module)
-            if inspect.isfunction(obj) and "_loader" in name
+            for name, obj in vars(self.loaders_module).items()
+            if "_loader" in name and type(obj) is FunctionType
         ]
 
         return supported_formats
 
-    @property
+    @cached_property
+    def _supported_formats_set(self) -> FrozenSet[str]:
+        """The same as self.supported_formats, but as a frozenset for fast membership tests."""
+        return frozenset(self.supported_formats)
+
+    @cached_property
+    def _loader_functions(self) -> Dict[str, Callable]:
+        """Cache of loader functions already resolved by self.get_loader(), by format."""
+        return {}
+
+    @cached_property
+    def _dumper_functions(self) -> Dict[str, Callable]:
+        """Cache of dumper functions already resolved by self.get_dumper(), by format."""
+        return {}
+
+    def get_loader(self, file_format: str) -> Callable:
+        """
+        Returns the function named '{file_format}_loader' from self.loaders_module.
+        Each function is only looked up once and then memoized.
+
+        Raises:
+            PydanticSerdesImportError: If no such function can be found.
+        """
+        try:
+            return self._loader_functions[file_format]
+        except KeyError:
+            pass
+
+        try:
+            loader_function = getattr(self.loaders_module, f"{file_format}_loader")
+        except AttributeError:
+            raise PydanticSerdesImportError(
+                f"Could not find a loader function with name {file_format}_loader"
+            )
+
+        self._loader_functions[file_format] = loader_function
+        return loader_function
+
+    def get_dumper(self, file_format: str) -> Callable:
+        """
+        Returns the function named '{file_format}_dumper' from self.dumpers_module.
+        Each function is only looked up once and then memoized.
+
+        Raises:
+            PydanticSerdesImportError: If no such function can be found.
+        """
+        try:
+            return self._dumper_functions[file_format]
+        except KeyError:
+            pass
+
+        try:
+            dumper_function = getattr(self.dumpers_module, f"{file_format}_dumper")
+        except AttributeError:
+            raise PydanticSerdesImportError(
+                f"Could not find a dumper function with name {file_format}_dumper"
+            )
+
+        self._dumper_functions[file_format] = dumper_function
+        return dumper_function
+
+    @cached_property
     def models_modules(self) -> List[str]:
         return os.environ.get("MODELS_MODULES", MODELS_MODULES).split(",")
 
     @property
     def directive_to_model_mapping(self) -> Dict[str, type]:
         """
-        Returns a dictionary with the directive names as keys and the dotted paths
-        to the corresponding PydanticSerdesBaseModel subclass as values.
-
-        Notice that this property returns self._directive_to_model_mapping, which will
-        be set once and always return that same value.
+        Returns a dictionary with the directive names as keys and the corresponding
+        PydanticSerdesBaseModel subclasses as values.
 
-        It's only if self._directive_to_model_mapping is empty that this method will
-        try to populate it:
-            - 1st: by importing all modules in self.models_modules; and
-            - 2nd: by iterating over all subclasses of PydanticSerdesBaseModel that
-              have the '_directive' field set.
+        Model classes register themselves in self._directive_to_model_mapping as soon
+        as they are created. Hence, all this property has to do is to make sure, the
+        first time it's called, that all modules in self.models_modules have been
+        imported. From then on, it's a plain dict return.
         """
-        if self._directive_to_model_mapping:
-            return self._directive_to_model_mapping
+        if not self._models_modules_imported:
+            self._import_all_models_modules()
+            self._models_modules_imported = True
 
-        self._import_all_models_modules()
+        return self._directive_to_model_mapping
 
-        # import here to avoid circular imports error
-        from pydantic_serdes.models import PydanticSerdesBaseModel
+    def reset_cache(self) -> None:
+        """
+        Drops all memoized configs, so that they will be resolved again from the
+        environment variables the next time they are accessed.
 
-        for cls in PydanticSerdesBaseModel.get_subclasses_with_directive():
-            self._directive_to_model_mapping[cls._directive.get_default()] = cls
+        Notice this does not touch self._directive_to_model_mapping, as model classes
+        remain registered for as long as the process lives. Modules in self.models_modules,
+        though, will be imported again the next time self.directive_to_model_mapping
+        is accessed.
+        """
+        for name, attr in inspect.getmembers(type(self)):
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
 
-        return self._directive_to_model_mapping
+        self._models_modules_imported = False
+
+        _cached_import.cache_clear()
 
     def _import_all_models_modules(self) -> None:
         """
@@ -135,10 +229,7 @@ class PydanticSerdesConfig:
             cannot be imported.
         """
         for module in self.models_modules:
-            try:
-                importlib.import_module(module)
-            except ImportError as err:
-                raise PydanticSerdesImportError(err)
+            _cached_import(module)
 
 
 GLOBAL_CONFIGS = None
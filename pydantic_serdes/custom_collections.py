@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from operator import attrgetter
 from typing import Generic, Tuple, TypeVar
 
 from sortedcontainers import SortedSet
@@ -38,15 +39,16 @@ class OneToMany(Tuple[T, ...], Generic[T]):
         if not iterable:
             raise ValueError("The OneToMany initialization iterable can't be empty")
 
-        # Check if all elements are of the same type
+        # Check, in a single pass, if all elements are of the same type and hashable.
+        # The exact type check is just a fast path for the (by far) most common
+        # case, so that isinstance() is only needed for instances of subclasses.
         first_type = type(iterable[0])
-        if not all(isinstance(item, first_type) for item in iterable):
-            raise TypeError(
-                "All elements of a OneToMany initialization iterable must be of the same type"
-            )
-
-        # Check if each element in the sequence is hashable
         for item in iterable:
+            if type(item) is not first_type and not isinstance(item, first_type):
+                raise TypeError(
+                    "All elements of a OneToMany initialization iterable must be of the same type"
+                )
+
             try:
                 hash(item)
             except TypeError:
@@ -74,10 +76,74 @@ class HashableDict(dict):
     NOTE: The requirement for a hashable dictionary is due to the fact that each
     model instance will be stored in a set data structure, implemented by the
     PydanticSerdesSortedSet class.
+
+    NOTE: The hash is computed only once and then cached. Any method that mutates
+    the dictionary drops the cached value, so it will be computed again next time.
     """
 
+    # the cached hash is the only attribute a HashableDict ever gets, so a slot
+    # spares each instance (and there may be many of them) a __dict__ of its own.
+    __slots__ = ("_hash",)
+
     def __hash__(self):
-        return hash((frozenset(self), frozenset(self.values())))
+        # computing the hash takes a walk over all items, so it's done only once
+        # and then cached until the dictionary is mutated.
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        # XOR is commutative, so the order of the items doesn't matter (just like
+        # it doesn't for dict equality), and no intermediate frozenset is needed.
+        _hash = 0
+        for item in self.items():
+            _hash ^= hash(item)
+
+        self._hash = _hash
+        return _hash
+
+    def __getstate__(self):
+        # the items are pickled (and copied) by dict itself. The cached hash is
+        # left out, as hashes of str values aren't the same across interpreter runs.
+        return None
+
+    def _invalidate_hash(self):
+        try:
+            del self._hash
+        except AttributeError:
+            pass
+
+    def __setitem__(self, key, value):
+        self._invalidate_hash()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_hash()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._invalidate_hash()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._invalidate_hash()
+        super().clear()
+
+    def pop(self, *args):
+        self._invalidate_hash()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._invalidate_hash()
+        return super().popitem()
+
+    def setdefault(self, *args):
+        self._invalidate_hash()
+        return super().setdefault(*args)
+
+    def update(self, *args, **kwargs):
+        self._invalidate_hash()
+        super().update(*args, **kwargs)
 
 
 class PydanticSerdesSortedSet(SortedSet):
@@ -87,9 +153,13 @@ class PydanticSerdesSortedSet(SortedSet):
 
     NOTE: the `key` property returns a tuple containing the values associated
     with attribute names found in the private `_key` field of a model object.
+    That tuple is memoized by the model on first access, so evaluating the key
+    on every comparison made by the sorted set is just an attribute lookup.
     For more details, look at pydantic_serdes.models.PydanticSerdesBaseModel
     class and sortedcontainers.SortedSet class.
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(key=lambda model_obj: model_obj.key, *args, **kwargs)
+        # attrgetter is implemented in C, so unlike a lambda it doesn't push a
+        # python frame every time sortedcontainers needs an element's key.
+        super().__init__(key=attrgetter("key"), *args, **kwargs)
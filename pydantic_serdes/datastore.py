@@ -1,7 +1,11 @@
-import inspect
 from collections import defaultdict
-from functools import cache
-from typing import TYPE_CHECKING, Any, DefaultDict, Dict, Optional, Type, Union
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import attrgetter, eq
+from typing import (TYPE_CHECKING, Any, ClassVar, DefaultDict, Dict, Iterable,
+                    Iterator, List, Optional, Set, Tuple, Type, Union)
+
+from pydantic import BaseModel, TypeAdapter
 
 from pydantic_serdes.custom_collections import PydanticSerdesSortedSet
 from pydantic_serdes.exceptions import (DataStoreDirectAssignmentError,
@@ -13,11 +17,31 @@ if TYPE_CHECKING:
     from pydantic_serdes.models import PydanticSerdesBaseModel
 
 
+@lru_cache(maxsize=None)
+def _get_list_adapter(model_class: Type["PydanticSerdesBaseModel"]) -> TypeAdapter:
+    """
+    Returns a TypeAdapter for a list of `model_class` instances. It's cached, so
+    the adapter for each model class is only ever built once.
+
+    Args:
+        model_class (Type["PydanticSerdesBaseModel"]): the class of the model.
+
+    Returns:
+        TypeAdapter: the TypeAdapter for List[model_class].
+    """
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
+# the secondary indexes of a single model class: each indexed field name maps to
+# the instances holding each of its values (see ModelsGlobalStore.__new__).
+_IndexMap = DefaultDict[str, DefaultDict[Any, Set["PydanticSerdesBaseModel"]]]
+
+
 class ModelsGlobalStore:
     """
     Implements a global store for all the models in the application.
 
-    Models are stored in a defaultdict, where the keys are the model
+    Models are stored in a dict, where the keys are the model
     classes names and the values are PydanticSerdesSortedSet objects.
 
     The PydanticSerdesSortedSet is a custom collection that stores the
@@ -33,15 +57,68 @@ class ModelsGlobalStore:
     Only one instance of this class is created, and it's shared across the
     entire application. This is done to ensure that all the models are stored
     in the same place and that they can be accessed from anywhere in the
-    application. See the `get_global_data_store` function for more details.
+    application: calling the class always returns that same instance (see
+    `__new__`), which is also what the `get_global_data_store` function returns.
     """
 
-    _records = defaultdict(PydanticSerdesSortedSet)
+    # self.records is accessed by every save and search operation, so its backing
+    # state is kept in slots rather than in an instance __dict__.
+    __slots__ = ("_records", "_indexes", "_unindexable", "_keys")
+
+    # see __new__ for details on each of them
+    _records: Dict[str, PydanticSerdesSortedSet]
+    _indexes: DefaultDict[str, _IndexMap]
+    _unindexable: DefaultDict[str, Set[str]]
+    _keys: DefaultDict[str, Set[Tuple]]
+
+    # the one and only instance of the class (see __new__).
+    _instance: ClassVar[Optional["ModelsGlobalStore"]] = None
+
+    def __new__(cls) -> "ModelsGlobalStore":
+        """
+        Returns the single instance of the class, which is only created (and has its
+        state initialized) the first time the class is called.
+        """
+        if cls._instance is not None:
+            return cls._instance
+
+        self = super().__new__(cls)
+
+        # the state is kept in the instance (rather than in class attributes), and is
+        # only ever initialized here, so calling the class again never resets it.
+        # a plain dict (rather than a defaultdict), so that no read path can ever
+        # insert an empty bucket into it. Buckets are only ever created by save().
+        self._records = {}
+
+        # Secondary indexes used to avoid linear scans when searching the records.
+        # For each model class name, it maps the name of an indexed field to another
+        # dict, where each field value points to the set of instances holding it:
+        # {
+        #     "Model1": {"field_name": {field_value: {Model1_instance1, ...}, ...}, ...},
+        #     ...
+        # }
+        # The fields in a model's `_key` and `_indexed_fields` are indexed on save.
+        # Any other field gets its index built the first time it's searched for.
+        self._indexes = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+
+        # For each model class name, the names searched for that no index could be
+        # built for (see _build_index()), so that searches by them go straight to a
+        # linear scan, rather than attempting to build the index every time.
+        self._unindexable = defaultdict(set)
+
+        # For each model class name, the set of the keys (see PydanticSerdesBaseModel.key)
+        # of all its instances in the store. This is what duplicates are checked against,
+        # as a hash lookup of a key tuple is way cheaper than a membership test in the
+        # sorted set (which has to hash and compare whole model instances).
+        self._keys = defaultdict(set)
+
+        cls._instance = self
+        return self
 
     @property
     def records(
         self,
-    ) -> DefaultDict[str, PydanticSerdesSortedSet]:
+    ) -> Dict[str, PydanticSerdesSortedSet]:
         return self._records
 
     @records.setter
@@ -50,20 +127,50 @@ class ModelsGlobalStore:
             "Cannot directly assign to attribute 'records' of a ModelsGlobalStore object."
         )
 
+    def clear(self) -> None:
+        """Removes all model instances (and their indexes) from the store."""
+        self._records.clear()
+        self._indexes.clear()
+        self._unindexable.clear()
+        self._keys.clear()
+
     def as_dict(self) -> Dict[str, Any]:
         """
         Returns regular python dict version of the records attribute.
         This makes it more human-friendly, as well easier to serialize the
         records attribute to a file by using any of the dumper functions in
         the dumpers module.
+
+        All records of a model class are serialized in a single call to a
+        pydantic TypeAdapter, so the loop over them runs inside pydantic-core.
+        Records of model classes overriding .model_dump() are serialized by it
+        instead, one by one, as the TypeAdapter would bypass the override.
+        """
+        return dict(self.iter_as_dict())
+
+    def iter_as_dict(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Lazily yields the same (class name, serialized records) pairs as_dict()
+        is made of, one model class at a time. This way, a caller that handles each
+        model class separately never has to hold all the serialized records at once.
+
+        Yields:
+            Tuple[str, List[Dict[str, Any]]]: the name of a model class and a list
+            with all its records serialized to dicts.
         """
+        for key, value in self._records.items():
+            if not value:
+                yield key, []
+                continue
 
-        dump = {}
+            model_class: Type["PydanticSerdesBaseModel"] = type(value[0])
 
-        for key, value in self.records.items():
-            dump[key] = [record.model_dump() for record in value]
+            if model_class.model_dump is not BaseModel.model_dump:
+                # the override is looked up once, rather than on every record
+                yield key, list(map(model_class.model_dump, value))
+                continue
 
-        return dump
+            yield key, _get_list_adapter(model_class).dump_python(list(value))
 
     def save(self, obj: "PydanticSerdesBaseModel") -> None:
         """
@@ -78,21 +185,291 @@ class ModelsGlobalStore:
             obj (PydanticSerdesBaseModel): the PydanticSerdesBaseModel instance to be saved.
 
         Raises:
-            ModelAlreadyExists: if the model instance is already in the store
-            and the `_err_on_duplicate` attribute is set to True.
+            ModelAlreadyExists: if an instance of the same model class with the same
+            key is already in the store and the `_err_on_duplicate` attribute is set
+            to True.
         """
         cls_name = self._get_cls_name(obj)
+        obj_key = self._check_key(cls_name, obj)
+        self._get_or_create_records(cls_name).add(obj)
+        self._index(cls_name, obj)
+
+        # the key is only registered once the instance is actually in the store, so
+        # a failed save (e.g. of an unhashable instance) leaves no key behind.
+        self._keys[cls_name].add(obj_key)
+
+    def save_many(self, objs: Iterable["PydanticSerdesBaseModel"]) -> None:
+        """
+        Saves many model instances to the global store, just like calling save() for
+        each of them would. However, unless any of them shares its key with another
+        instance, the instances of each model class are added to its
+        PydanticSerdesSortedSet at once (see SortedSet.update()), so a large batch
+        gets sorted a single time, rather than bisected into the set one by one.
+
+        Args:
+            objs (Iterable[PydanticSerdesBaseModel]): the PydanticSerdesBaseModel
+            instances to be saved.
+
+        Raises:
+            ModelAlreadyExists: just like save() does. Any instances preceding the
+            duplicate one are still saved.
+            TypeError: if any of the instances isn't hashable. Any instances preceding
+            it are still saved.
+        """
+        batches: Dict[str, List["PydanticSerdesBaseModel"]] = {}
+        batch_keys: DefaultDict[str, Set[Tuple]] = defaultdict(set)
+
+        # names of the classes with instances sharing a key (see below)
+        shared_keys: Set[str] = set()
+
+        try:
+            for obj in objs:
+                cls_name = self._get_cls_name(obj)
+                obj_key = self._check_key(cls_name, obj, batch_keys[cls_name])
+
+                # hashing is done up front (its value is memoized anyway), so an
+                # unhashable instance is never let into the batch, which then can't
+                # fail halfway through being saved below.
+                hash(obj)
+
+                if obj_key in batch_keys[cls_name] or obj_key in self._keys[cls_name]:
+                    shared_keys.add(cls_name)
+
+                batch_keys[cls_name].add(obj_key)
+                batches.setdefault(cls_name, []).append(obj)
+        finally:
+            # whatever made it into the batches must be saved, so that records,
+            # keys and indexes never get out of sync.
+            for cls_name, batch in batches.items():
+                records = self._get_or_create_records(cls_name)
+
+                # SortedSet.update() goes through a hash set, so instances sharing a
+                # key would end up in an order depending on their hashes. These are
+                # added one by one instead, each after any other one with its key.
+                if cls_name in shared_keys:
+                    for obj in batch:
+                        records.add(obj)
+                else:
+                    records.update(batch)
+
+                for obj in batch:
+                    self._index(cls_name, obj)
+
+                self._keys[cls_name].update(batch_keys[cls_name])
+
+    def _check_key(
+        self,
+        cls_name: str,
+        obj: "PydanticSerdesBaseModel",
+        pending_keys: Optional[Set[Tuple]] = None,
+    ) -> Tuple:
+        """
+        Checks the key of a model instance for duplicates among the keys of its class.
+        The key isn't registered, though: that's up to the caller, once the instance
+        is actually saved.
+
+        Args:
+            cls_name (str): the name of the class of the model instance.
+            obj (PydanticSerdesBaseModel): the model instance being saved.
+            pending_keys (Optional[Set[Tuple]]): keys of instances of the same class
+            about to be saved along with this one (see save_many()), which are checked
+            as well. Defaults to None.
+
+        Returns:
+            Tuple: the key of the model instance.
 
-        if obj in self.records[cls_name] and obj._err_on_duplicate:
+        Raises:
+            ModelAlreadyExists: if an instance of the same model class with the same
+            key is already in the store and the `_err_on_duplicate` attribute is set
+            to True.
+        """
+        obj_key = obj.key
+
+        if obj._err_on_duplicate and (
+            obj_key in self._keys[cls_name]
+            or (pending_keys is not None and obj_key in pending_keys)
+        ):
             raise ModelInstanceAlreadyExistsError(
-                f"{cls_name}: duplicates not allowed. Make sure there's no other "
-                f"{cls_name} with fields {obj._key} associated with values {obj.key}, respectively."
+                model_cls=type(obj), key_fields=obj._key_fields, key_values=obj_key
             )
 
-        self.records[cls_name].add(obj)
+        return obj_key
+
+    def _discard(self, obj: "PydanticSerdesBaseModel") -> bool:
+        """
+        Removes a model instance from the records of its class and from its secondary
+        indexes, along with its key (unless another record has that same key), so that
+        it can be saved (and indexed) again once its fields are changed.
+
+        Args:
+            obj (PydanticSerdesBaseModel): the model instance to be removed.
+
+        Returns:
+            bool: True if that very instance was in the store, False otherwise.
+        """
+        cls_name = self._get_cls_name(obj)
+        records = self._records.get(cls_name)
+
+        if not records or obj not in records:
+            return False
+
+        # the one in the store may be an equal, but distinct instance
+        if not any(record is obj for record in records.irange(obj, obj)):
+            return False
+
+        records.remove(obj)
+
+        for field, index in self._indexes[cls_name].items():
+            value = getattr(obj, field)
+            bucket = index[value]
+            bucket.discard(obj)
+
+            if not bucket:
+                del index[value]
+
+        key = obj.key
+
+        if next(records.irange_key(key, key), None) is None:
+            self._keys[cls_name].discard(key)
+
+        return True
+
+    def _get_or_create_records(self, cls_name: str) -> PydanticSerdesSortedSet:
+        """
+        Returns the PydanticSerdesSortedSet holding the records of a given model
+        class, creating it first if no instance of that class was ever saved.
+
+        Args:
+            cls_name (str): the name of the class of the model.
+
+        Returns:
+            PydanticSerdesSortedSet: the records of the given model class.
+        """
+        records = self._records.get(cls_name)
+
+        if records is None:
+            records = self._records[cls_name] = PydanticSerdesSortedSet()
+
+        return records
+
+    def _index(self, cls_name: str, obj: "PydanticSerdesBaseModel") -> None:
+        """
+        Adds a model instance to the secondary indexes of its class. Every field
+        named either in the `_key` or in the `_indexed_fields` attributes of the
+        model is indexed, as well as any field an index was lazily built for
+        by a previous search (see _build_index()).
+
+        Args:
+            cls_name (str): the name of the class of the model instance.
+            obj (PydanticSerdesBaseModel): the model instance to be indexed.
+        """
+        indexes = self._indexes[cls_name]
+
+        fields = obj._key_fields + tuple(obj._indexed_fields) + tuple(indexes)
+
+        for field in dict.fromkeys(fields):
+            indexes[field][getattr(obj, field)].add(obj)
+
+    def _build_index(self, cls_name: str, field: str) -> bool:
+        """
+        Builds the secondary index of a field that is neither part of the `_key`
+        nor of the `_indexed_fields` of a model class, in a single pass over its
+        records. Once built, the index is kept up to date by save() and _discard().
+
+        Only model fields get an index built (rather than any attribute a record may
+        have, like private attributes or properties), as assigning to a model field is
+        the only change _discard() is ever called for (see PydanticSerdesBaseModel).
+
+        Args:
+            cls_name (str): the name of the class of the model to be indexed.
+            field (str): the name of the field to be indexed.
+
+        Returns:
+            bool: True if the index could be built, False otherwise (i.e. if the
+            field isn't a model field or any of its values isn't hashable).
+        """
+        records = self._records[cls_name]
+
+        if not records or field not in type(records[0]).model_fields:
+            return False
+
+        get_value = attrgetter(field)
+        index = defaultdict(set)
+
+        try:
+            for record in records:
+                index[get_value(record)].add(record)
+        except (AttributeError, TypeError):
+            return False
+
+        self._indexes[cls_name][field] = index
+        return True
+
+    def _indexed_search(
+        self, cls_name: str, search_params: Dict[Any, Any]
+    ) -> Optional[List["PydanticSerdesBaseModel"]]:
+        """
+        Searches the records of a given model class by intersecting the secondary
+        indexes matching each of the search_params.
+
+        Args:
+            cls_name (str): the name of the class of the model to be searched.
+            search_params (Dict[Any, Any]): a dictionary with keys being the
+            attributes of the model and the values being the values to be searched for.
+
+        Returns:
+            Optional[List[PydanticSerdesBaseModel]]: a list with the records that match
+            the search_params, sorted the same way they are in the store, or None if any
+            of the search_params can't be served by an index (so the caller must fall
+            back to a full scan).
+        """
+        indexes = self._indexes.get(cls_name)
+
+        if indexes is None:
+            return None
+
+        unindexable = self._unindexable[cls_name]
+
+        for k in search_params:
+            if k in indexes:
+                continue
+
+            if k in unindexable or not self._build_index(cls_name, k):
+                unindexable.add(k)
+                return None
 
+        matches: Optional[Set["PydanticSerdesBaseModel"]] = None
+
+        for k, v in search_params.items():
+            try:
+                bucket = indexes[k].get(v)
+            except TypeError:
+                # unhashable values can't be looked up in an index
+                return None
+
+            if not bucket:
+                return []
+
+            matches = bucket if matches is None else matches & bucket
+
+        if not matches:
+            return []
+
+        # matches is a set, so it can't tell the order records sharing the same key
+        # are in. Instead, each distinct key is looked up in the sorted set, whose
+        # records holding it are taken in their very order in the store.
+        records = self._records[cls_name]
+
+        return [
+            record
+            for key in sorted({match.key for match in matches})
+            for record in records.irange_key(key, key)
+            if record in matches
+        ]
+
+    @staticmethod
     def _get_cls_name(
-        self, obj: Union[Type["PydanticSerdesBaseModel"], "PydanticSerdesBaseModel"]
+        obj: Union[Type["PydanticSerdesBaseModel"], "PydanticSerdesBaseModel"]
     ) -> str:
         """
         Returns the name of the class of the given object.
@@ -104,53 +481,83 @@ class ModelsGlobalStore:
         Returns:
             str: the name of the class of the given object.
         """
-        if inspect.isclass(obj):
-            return obj.__name__
-
-        return obj.__class__.__name__
+        return obj.__name__ if isinstance(obj, type) else type(obj).__name__
 
-    def _search(
-        self,
-        model_class: Type["PydanticSerdesBaseModel"],
-        search_params: Optional[Dict[Any, Any]] = None,
-    ) -> PydanticSerdesSortedSet:
+    def _iter_matches(
+        self, cls_name: str, search_params: Optional[Dict[Any, Any]] = None
+    ) -> Iterator["PydanticSerdesBaseModel"]:
         """
-        Searches the records of a given model class based on the search_params.
+        Lazily yields the records of a given model class that match the search_params.
+        Records are yielded in the same order they are sorted in the store.
 
         Args:
-            model_class (Type["PydanticSerdesBaseModel"]): the class of the model to
-            be searched.
+            cls_name (str): the name of the class of the model to be searched.
             search_params (Optional[Dict[Any, Any]]): a dictionary with keys being the
             attributes of the model and the values being the values to be searched for.
-            If `None`, returns the entire PydanticSerdesSortedSet associated with
-            `model_class` key. Defaults to None.
+            If `None` (or empty), all records of the model class are yielded. Defaults
+            to None.
 
-        Returns:
-            PydanticSerdesSortedSet: the PydanticSerdesSortedSet containing the records
-            that match the search_params.
-        """
-        cls_name = self._get_cls_name(model_class)
-
-        if search_params:
-            return PydanticSerdesSortedSet(
-                [
-                    x
-                    for x in self.records[cls_name]
-                    if all(getattr(x, k) == v for k, v in search_params.items())
-                ]
-            )
+        Yields:
+            PydanticSerdesBaseModel: each record matching the search_params.
+        """
+        records = self._records.get(cls_name, ())
+
+        if not records:
+            return
+
+        if not search_params:
+            yield from records
+            return
+
+        indexed_matches = self._indexed_search(cls_name, search_params)
 
-        return self.records[cls_name]
+        if indexed_matches is not None:
+            yield from indexed_matches
+            return
+
+        # the attribute getter is bound once and the values of each record are
+        # compared against the searched ones through map(), so the scan runs in C
+        # rather than through a python-level loop.
+        get_values = attrgetter(*search_params)
+        values: Any = tuple(search_params.values())
+
+        if len(values) == 1:
+            # attrgetter() returns a bare value (not a tuple) for a single attribute
+            values = values[0]
+
+        yield from compress(records, map(eq, map(get_values, records), repeat(values)))
 
     def filter(
         self,
         model_class: Type["PydanticSerdesBaseModel"],
         search_params: Dict[Any, Any],
-    ) -> PydanticSerdesSortedSet:
+    ) -> List["PydanticSerdesBaseModel"]:
         """
-        Avails of self._search() to filter the records of a given model class
+        Avails of self._iter_matches() to filter the records of a given model class
         based on the search_params.
 
+        Args:
+            model_class (Type["PydanticSerdesBaseModel"]): the class of the
+            model to be filtered.
+            search_params (Dict[Any, Any]): the search parameters to be used
+            to filter the records.
+
+        Returns:
+            List[PydanticSerdesBaseModel]: a list containing the records that match
+            the search_params, in the same order they are sorted in the store.
+        """
+        return list(self._iter_matches(self._get_cls_name(model_class), search_params))
+
+    def filter_sorted(
+        self,
+        model_class: Type["PydanticSerdesBaseModel"],
+        search_params: Dict[Any, Any],
+    ) -> PydanticSerdesSortedSet:
+        """
+        Same as self.filter(), but the records matching the search_params are
+        returned in a new PydanticSerdesSortedSet. Only use it if you really need
+        the features of a sorted set, as building one isn't free.
+
         Args:
             model_class (Type["PydanticSerdesBaseModel"]): the class of the
             model to be filtered.
@@ -161,7 +568,9 @@ class ModelsGlobalStore:
             PydanticSerdesSortedSet: the PydanticSerdesSortedSet containing
             the records that match the search_params.
         """
-        return self._search(model_class, search_params)
+        return PydanticSerdesSortedSet(
+            self._iter_matches(self._get_cls_name(model_class), search_params)
+        )
 
     def get(
         self,
@@ -169,8 +578,9 @@ class ModelsGlobalStore:
         search_params: Dict[Any, Any],
     ) -> "PydanticSerdesBaseModel":
         """
-        Avails of self.filter() method to get a single model instance from
-        the global store based on the search_params.
+        Avails of self._iter_matches() method to get a single model instance from
+        the global store based on the search_params. No more than two matching
+        records are ever looked at.
 
         Args:
             model_class (Type["PydanticSerdesBaseModel"]): the class of the model
@@ -187,50 +597,49 @@ class ModelsGlobalStore:
         Returns:
             PydanticSerdesBaseModel: a single PydanticSerdesBaseModel instance.
         """
-        search = self.filter(model_class, search_params)
+        matches = self._iter_matches(self._get_cls_name(model_class), search_params)
+        found = next(matches, None)
 
-        if not search:
+        if found is None:
             raise ModelInstanceDoesNotExistError(
                 f"A {model_class.__name__} object was not found matching params: {search_params}"
             )
 
-        if len(search) > 1:
+        if next(matches, None) is not None:
             raise MultipleModelInstancesReturnedError("More than one element found")
 
-        return search[0]
+        return found
 
     def get_all_by_class(
         self, model_class: Type["PydanticSerdesBaseModel"]
     ) -> PydanticSerdesSortedSet:
         """
-        Avails of self._search() method to get all the records of a given
-        model class from the global store.
+        Gets all the records of a given model class from the global store.
 
         Args:
             model_class (Type["PydanticSerdesBaseModel"]): the class of the model
 
         Returns:
             PydanticSerdesSortedSet: the PydanticSerdesSortedSet containing all the
-            records of the given model class.
+            records of the given model class. If no instance of that class has ever
+            been saved, a new (empty) PydanticSerdesSortedSet is returned, which is
+            not added to the store.
         """
-        return self._search(model_class)
+        records = self._records.get(self._get_cls_name(model_class))
 
+        return PydanticSerdesSortedSet() if records is None else records
 
-GLOBAL_DATA_STORE = None
 
+# the shared instance of the ModelsGlobalStore, created as soon as this module is
+# imported (see get_global_data_store()).
+GLOBAL_DATA_STORE = ModelsGlobalStore()
 
-@cache
-def get_global_data_store():
+
+def get_global_data_store() -> ModelsGlobalStore:
     """
-    Returns the shared instance of the ModelsGlobalStore. It's a cached function,
-    meaning that it will only be executed once and the result will be stored in memory.
-    This is done to ensure that the same instance of the class is returned every time
-    the function is called.
+    Returns the shared instance of the ModelsGlobalStore, which is created once,
+    when this module is imported, and stored in GLOBAL_DATA_STORE. Since the class
+    is a singleton (see ModelsGlobalStore.__new__), calling ModelsGlobalStore()
+    returns that same instance as well.
     """
-
-    global GLOBAL_DATA_STORE
-
-    if GLOBAL_DATA_STORE is None:
-        GLOBAL_DATA_STORE = ModelsGlobalStore()
-
     return GLOBAL_DATA_STORE
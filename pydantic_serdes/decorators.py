@@ -1,4 +1,5 @@
 import io
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, TextIO, Union
 
@@ -8,6 +9,28 @@ from pydantic_serdes.custom_collections import OneToMany
 from pydantic_serdes.exceptions import PydanticSerdesDumperError
 
 
+def _make_onetomany_validator(field_name: str, expected_type: type) -> Callable:
+    """
+    Builds the validator function for a single OneToMany field.
+
+    Having a dedicated factory guarantees each validator is bound to its own
+    `field_name` and `expected_type`, instead of late-binding to whatever values
+    the loop variables in `onetomany_validators` ended up with.
+    """
+
+    def onetomany_validator(cls, v):
+        for item in v:
+            if type(item) is not expected_type and not isinstance(item, expected_type):
+                raise TypeError(
+                    f"Each item in {field_name} must be a {expected_type.__name__} instance"
+                )
+        return v
+
+    onetomany_validator.__name__ = f"validate_{field_name}"
+
+    return onetomany_validator
+
+
 def onetomany_validators(cls):
     """
     A decorator that adds field validators to a class for fields of type OneToMany.
@@ -29,17 +52,12 @@ def onetomany_validators(cls):
     for field_name, field_type in cls.__annotations__.items():
         if getattr(field_type, "__origin__", None) is OneToMany:
             expected_type = field_type.__args__[0]
-            def onetomany_validator(cls, v):
-                if not all(isinstance(item, expected_type) for item in v):
-                    raise TypeError(
-                        f"Each item in {field_name} must be a {expected_type.__name__} instance"
-                    )
-                return v
-
             setattr(
                 cls,
                 f"validate_{field_name}",
-                field_validator(field_name)(onetomany_validator),
+                field_validator(field_name)(
+                    _make_onetomany_validator(field_name, expected_type)
+                ),
             )
 
     return cls
@@ -69,21 +87,43 @@ def stream_dumper(dump_func: Callable[..., None]):
             PydanticSerdesDumperError: If any exception occurs while dumping the data.
         """
         try:
-            stream = io.StringIO()
-            dump_func(data, stream, *args, **kwargs)
+            # the stream is closed as soon as its contents are taken, so its buffer
+            # is released before the (possibly large) data is written to a file.
+            with io.StringIO() as stream:
+                dump_func(data, stream, *args, **kwargs)
+
+                # .getvalue() copies the whole buffer into a new string every time
+                # it's called, so it's called only once.
+                serialized_data = stream.getvalue()
 
             if file_path is not None:
                 with open(file_path, "w") as file:
-                    file.write(stream.getvalue())
+                    file.write(serialized_data)
 
-            return stream.getvalue()
+            return serialized_data
         except Exception as e:
             raise PydanticSerdesDumperError(str(e))
 
     return standard_dumper_func
 
 
-def stream_loader(load_func: Callable[..., Dict]):
+def stream_loader(
+    load_func: Optional[Callable[..., Dict]] = None, *, binary: bool = False
+):
+    """
+    Can be used either as @stream_loader or as @stream_loader(binary=True).
+
+    With binary=True, file paths are opened in binary mode, so the loader function
+    gets the raw bytes of the file (e.g. to hand them over straight to a C parser),
+    sparing python from decoding the whole file into a string first. Notice the
+    loader function must still be able to handle a TextIO object, in case one is
+    passed directly to it.
+    """
+    if load_func is None:
+        return partial(stream_loader, binary=binary)
+
+    open_mode = "rb" if binary else "r"
+
     def standard_loader_func(source: Union[Path, str, TextIO], *args, **kwargs) -> dict:
         """
         This decorator wraps a loader function to allow it to handle different types of input sources.
@@ -103,7 +143,7 @@ def stream_loader(load_func: Callable[..., Dict]):
         """
 
         if isinstance(source, (str, Path)):
-            with open(source, "r") as stream:
+            with open(source, open_mode) as stream:
                 dictionary = load_func(stream, *args, **kwargs)
         else:
             dictionary = load_func(source, *args, **kwargs)
@@ -18,41 +18,195 @@ for the desired serialization format.
 import configparser
 import io
 import json
-from typing import Any, Dict
-
-import toml
-import yaml
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
+from pydantic_serdes.config import get_config
 from pydantic_serdes.decorators import stream_dumper
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NOTE: yaml and toml are only imported when a dumper function for any of these
+# formats is called for the first time. This way, users that never touch these
+# formats don't have to pay for importing them.
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_dumper_cls() -> type:
+    """
+    Returns a safe YAML dumper class (backed by LibYAML, if available) that also
+    knows how to represent the hashable collections pydantic-serdes models are
+    made of (tuples, like OneToMany, and dict subclasses, like HashableDict) as
+    plain YAML sequences and mappings, respectively. This way, whatever is dumped
+    can always be loaded back by a safe loader.
+
+    The class is only ever created once, the first time this function is called.
+    """
+    # LibYAML bindings are way faster than the pure python implementation,
+    # but they might not be available depending on how PyYAML was built.
+    try:
+        from yaml import CSafeDumper as _YamlBaseDumper
+    except ImportError:
+        from yaml import SafeDumper as _YamlBaseDumper
+
+    class _YamlDumper(_YamlBaseDumper):
+        pass
+
+    _YamlDumper.add_multi_representer(tuple, _YamlDumper.represent_list)
+    _YamlDumper.add_multi_representer(dict, _YamlDumper.represent_dict)
+
+    return _YamlDumper
+
 
 @stream_dumper
 def json_dumper(data: Dict[Any, Any], stream: io.StringIO, *args, **kwargs) -> str:
-    """Writes data to a JSON stream and optionally to a file."""
+    """
+    Writes data to a JSON stream and optionally to a file.
+
+    If orjson is installed and the USE_ORJSON env var is set to "1", it's used to
+    serialize the data in a single call and the result is written to the stream at
+    once. The only keyword arguments it can honor, though, are `sort_keys` and
+    `indent` (as long as it's 2). For anything else, as well as for any data orjson
+    refuses to serialize (e.g. integers that don't fit in 64 bits), the stdlib json
+    module is used instead.
+
+    NOTE: when serialized by orjson without `indent`, the JSON is as compact
+    as possible (no whitespaces after separators).
+    """
+    if (
+        orjson is not None
+        and not args
+        and kwargs.keys() <= {"sort_keys", "indent"}
+        and get_config().use_orjson
+    ):
+        option = orjson.OPT_NON_STR_KEYS
+
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+
+        indent = kwargs.get("indent")
+
+        if indent is None or indent == 2:
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+
+            try:
+                serialized = orjson.dumps(data, option=option)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                stream.write(serialized.decode("utf-8"))
+                return
+
     json.dump(data, stream, *args, **kwargs)
 
 
 @stream_dumper
 def yaml_dumper(data: Dict[Any, Any], stream: io.StringIO, *args, **kwargs) -> str:
-    """Writes data to a YAML stream and optionally to a file."""
+    """
+    Writes data to a YAML stream and optionally to a file. Unless a `Dumper` is
+    passed, a safe dumper (backed by LibYAML, if available) is used.
+    """
+    import yaml
+
+    kwargs.setdefault("Dumper", _get_yaml_dumper_cls())
     yaml.dump(data, stream, *args, **kwargs)
 
 
 @stream_dumper
 def yml_dumper(data: Dict[Any, Any], stream: io.StringIO, *args, **kwargs) -> str:
-    """Writes data to a YAML stream and optionally to a file."""
+    """
+    Writes data to a YAML stream and optionally to a file. Unless a `Dumper` is
+    passed, a safe dumper (backed by LibYAML, if available) is used.
+    """
+    import yaml
+
+    kwargs.setdefault("Dumper", _get_yaml_dumper_cls())
     yaml.dump(data, stream, *args, **kwargs)
 
 
 @stream_dumper
 def ini_dumper(data: Dict[Any, Any], stream: io.StringIO, *args, **kwargs) -> str:
-    """Writes data to an INI stream and optionally to a file."""
-    config = configparser.ConfigParser()
-    config.read_dict(data)
-    config.write(stream, *args, **kwargs)
+    """
+    Writes data to an INI stream and optionally to a file.
+
+    Whenever possible, the INI text is built straight from `data` and written to the
+    stream at once, producing the very same output a ConfigParser would (see
+    _format_ini()). A ConfigParser is only used when any *args, **kwargs are passed,
+    when a 'DEFAULT' section is present, or when any value is None or holds a '%'
+    (which ConfigParser would have to validate).
+    """
+    ini_text = None if args or kwargs else _format_ini(data)
+
+    if ini_text is None:
+        config = configparser.ConfigParser()
+        config.read_dict(data)
+        config.write(stream, *args, **kwargs)
+        return
+
+    stream.write(ini_text)
+
+
+def _format_ini(data: Dict[Any, Any]) -> Optional[str]:
+    """
+    Formats `data` as INI text, just like ConfigParser.read_dict() followed by
+    ConfigParser.write() would: section names and values are converted to str,
+    option names are lower-cased and multiline values are indented.
+
+    Returns:
+        Optional[str]: the INI text, or None if `data` holds anything only a
+        ConfigParser can properly handle.
+
+    Raises:
+        configparser.DuplicateSectionError: if two sections end up with the same name.
+        configparser.DuplicateOptionError: if two options of a section end up with
+        the same name.
+    """
+    lines = []
+    seen_sections = set()
+
+    for section, options in data.items():
+        section = str(section)
+
+        if section == configparser.DEFAULTSECT:
+            return None
+
+        if section in seen_sections:
+            raise configparser.DuplicateSectionError(section)
+        seen_sections.add(section)
+
+        lines.append(f"[{section}]\n")
+        seen_options = set()
+
+        for option, value in options.items():
+            option = str(option).lower()
+
+            if option in seen_options:
+                raise configparser.DuplicateOptionError(section, option)
+            seen_options.add(option)
+
+            if value is None:
+                return None
+
+            value = str(value)
+
+            if "%" in value:
+                return None
+
+            value = value.replace("\n", "\n\t")
+            lines.append(f"{option} = {value}\n")
+
+        lines.append("\n")
+
+    return "".join(lines)
 
 
 @stream_dumper
 def toml_dumper(data: Dict[Any, Any], stream: io.StringIO, *args, **kwargs) -> str:
     """Writes data to a TOML stream and optionally to a file."""
+    import toml
+
     toml.dump(data, stream, *args, **kwargs)
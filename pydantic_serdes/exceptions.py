@@ -30,7 +30,38 @@ class ModelInstanceDoesNotExistError(PydanticSerdesBaseException):
 
 
 class ModelInstanceAlreadyExistsError(PydanticSerdesBaseException):
-    """Model already exists in the datastore."""
+    """
+    Model already exists in the datastore.
+
+    Besides a regular message, it can be given the model class and its key fields
+    and values, in which case the message is only formatted when actually needed.
+    """
+
+    def __init__(self, *args, model_cls=None, key_fields=None, key_values=None):
+        # without a message, the components are passed along as the args of the
+        # exception, so that .args, repr() and pickling work just like they'd do
+        # for the formatted message.
+        self._is_lazy = not args and model_cls is not None
+
+        if self._is_lazy:
+            args = (model_cls, key_fields, key_values)
+
+        super().__init__(*args)
+        self.model_cls = model_cls
+        self.key_fields = key_fields
+        self.key_values = key_values
+
+    def __str__(self):
+        if not self._is_lazy:
+            return super().__str__()
+
+        cls_name = self.model_cls.__name__
+
+        return (
+            f"{cls_name}: duplicates not allowed. Make sure there's no other "
+            f"{cls_name} with fields {self.key_fields} associated with values "
+            f"{self.key_values}, respectively."
+        )
 
 
 class MultipleModelInstancesReturnedError(PydanticSerdesBaseException):
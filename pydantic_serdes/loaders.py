@@ -23,33 +23,121 @@ data itself. After parsing that data, your function must return a dictionary.
 
 import configparser
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TextIO, Union
 
-import toml
-import yaml
-
+from pydantic_serdes.config import get_config
 from pydantic_serdes.decorators import stream_loader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@stream_loader
+# NOTE: yaml and toml (or tomllib) are only imported when a loader function for
+# any of these formats is called for the first time. This way, users that never
+# touch these formats don't have to pay for importing them.
+
+
+@stream_loader(binary=True)
 def json_loader(source: Union[Path, str, TextIO], *args, **kwargs) -> dict:
-    """Parses a json text stream and returns a dictionary with its contents."""
+    """
+    Parses a json stream and returns a dictionary with its contents.
+
+    If orjson is installed and the USE_ORJSON env var is set to "1", it's used to
+    parse the whole stream at once (files are read as bytes, which orjson parses
+    directly). Since it doesn't take any options, the stdlib json module is used
+    instead whenever any *args, **kwargs are passed, as well as for any data orjson
+    refuses to parse (e.g. NaN or Infinity values).
+
+    NOTE: orjson parses integers that don't fit in 64 bits as floats.
+    """
+    if orjson is not None and not args and not kwargs and get_config().use_orjson:
+        data = source.read()
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
     return json.load(source, *args, **kwargs)
 
 
-@stream_loader
+@lru_cache(maxsize=None)
+def _get_yaml_loader_cls() -> type:
+    """
+    Returns a safe YAML loader class (backed by LibYAML, if available) that also
+    knows how to construct the `!!python/tuple` tags that older versions of
+    pydantic-serdes wrote for tuples (e.g. OneToMany fields), just like the unsafe
+    yaml.FullLoader these versions used to load them with did.
+
+    The class is only ever created once, the first time this function is called.
+    """
+    # LibYAML bindings are way faster than the pure python implementation,
+    # but they might not be available depending on how PyYAML was built.
+    try:
+        from yaml import CSafeLoader as _YamlBaseLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlBaseLoader
+
+    class _YamlLoader(_YamlBaseLoader):
+        def construct_python_tuple(self, node):
+            return tuple(self.construct_sequence(node))
+
+    _YamlLoader.add_constructor(
+        "tag:yaml.org,2002:python/tuple", _YamlLoader.construct_python_tuple
+    )
+
+    return _YamlLoader
+
+
+@stream_loader(binary=True)
 def yaml_loader(source: Union[Path, str, TextIO], *args, **kwargs) -> dict:
-    """Parses a yaml text stream and returns a dictionary with its contents."""
+    """
+    Parses a yaml stream and returns a dictionary with its contents. Files are read
+    as bytes, which are decoded by the YAML parser itself.
+
+    Serialized data is expected to be made of plain data only, so a safe loader
+    (backed by LibYAML, if available) is used. See _get_yaml_loader_cls().
+    """
+
+    import yaml
 
     # yaml.load doesn't take any *args, **kwargs
-    return yaml.load(source, Loader=yaml.FullLoader)
+    return yaml.load(source, Loader=_get_yaml_loader_cls())
 
 
-@stream_loader
+@stream_loader(binary=True)
 def toml_loader(source: Union[Path, str, TextIO], *args, **kwargs) -> dict:
-    """Parses a toml text stream and returns a dictionary with its contents."""
-    return toml.load(source, *args, **kwargs)
+    """
+    Parses a toml stream and returns a dictionary with its contents.
+
+    The whole stream is read at once and parsed by tomllib (or tomli, for python < 3.11),
+    which is way faster than the toml package. Since they don't take the same
+    options, though, the toml package is used instead whenever any *args, **kwargs
+    are passed.
+    """
+    data = source.read()
+
+    # TOML documents are always UTF-8 encoded
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+
+    if not args and not kwargs:
+        # tomllib is only part of the stdlib as of python 3.11. For older versions,
+        # tomli (which tomllib is based on) provides the very same API.
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
+        return tomllib.loads(data)
+
+    import toml
+
+    return toml.loads(data, *args, **kwargs)
 
 
 @stream_loader
@@ -1,24 +1,79 @@
 import re
 from collections.abc import Iterable
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Dict, FrozenSet,
+                    List, Optional, Tuple, Union)
 
-from jinja2 import Environment, FileSystemLoader, Template
-from jinja2.exceptions import TemplateNotFound
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import PydanticUndefined
 
 from pydantic_serdes.config import get_config
 from pydantic_serdes.custom_collections import OneToMany
 from pydantic_serdes.datastore import (ModelsGlobalStore,
                                        PydanticSerdesSortedSet,
+                                       _get_list_adapter,
                                        get_global_data_store)
 from pydantic_serdes.decorators import onetomany_validators
 from pydantic_serdes.exceptions import (ModelInitializationError,
+                                        ModelInstanceAlreadyExistsError,
                                         PydanticSerdesTypeError,
                                         RenderableTemplateError)
 from pydantic_serdes.utils import convert_dict_to_hashabledict
 
+# NOTE: jinja2 is only imported the first time a template is needed, so that
+# users that never render any model don't have to pay for importing it.
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
 GLOBAL_CONFIGS = get_config()
 
+# used to split a class name on its capital letters (e.g. MyClass -> My, Class)
+_CAMEL_RE = re.compile("[A-Z][^A-Z]*")
+
+
+@lru_cache(maxsize=None)
+def _get_key_getter(key_fields: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """
+    Returns a callable that takes a model instance and returns a tuple with the
+    values of its `key_fields`, in a single C-level attrgetter call. It's cached,
+    so that each `_key` gets its getter built only once.
+    """
+    if len(key_fields) == 1:
+        # attrgetter() returns a bare value (not a tuple) for a single attribute
+        get_value = attrgetter(key_fields[0])
+        return lambda obj: (get_value(obj),)
+
+    if not key_fields:
+        return lambda obj: ()
+
+    return attrgetter(*key_fields)
+
+
+@lru_cache(maxsize=None)
+def _get_jinja_env(templates_dir: str) -> "Environment":
+    """
+    Returns the jinja2 Environment for `templates_dir`. It's cached, so that a
+    single Environment is ever created for each templates directory.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir), auto_reload=False, cache_size=-1
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_compiled_template(templates_dir: str, template_name: str) -> "Template":
+    """
+    Returns the compiled jinja2 Template named `template_name` from `templates_dir`.
+    It's cached, so that each template file is only ever read and compiled once.
+
+    Raises:
+        TemplateNotFound: if the template file does not exist.
+    """
+    return _get_jinja_env(templates_dir).get_template(f"{template_name}.j2")
+
 
 class PydanticSerdesBaseModel(BaseModel):
     """A pydantic BaseModel class that provides the basic
@@ -32,6 +87,11 @@ class PydanticSerdesBaseModel(BaseModel):
     pydantic-serdes models MUST be hashable. This has a twofold consequence:
         - Model classes must implement the __hash__() method;
         - all attributes of any pydantic-serdes model class must be hashable;
+
+    Field values must also never be mutated in place once a model instance is
+    created (e.g. a HashableDict field getting a new item). Its key and hash are
+    memoized, and it may already be held by the sets of the data store, none of
+    which would notice the change. Assign a new value to the field instead.
     """
 
     # this class attribute is used as a registry for all subclasses
@@ -40,6 +100,10 @@ class PydanticSerdesBaseModel(BaseModel):
     # to model classes.
     _subclasses: ClassVar = []
 
+    # names of the fields of this class annotated as OneToMany. It's computed
+    # only once per subclass, as soon as it's created (see __init_subclass__).
+    _onetomany_fields: ClassVar[FrozenSet[str]] = frozenset()
+
     # class attribute to store a reference to the global data structure
     # where all model instances are stored.
     _data_store: ClassVar = get_global_data_store()
@@ -57,6 +121,27 @@ class PydanticSerdesBaseModel(BaseModel):
     # a sort key in the data store. Child classes MUST override this attribute.
     _key: Tuple[str]
 
+    # the very same field names in `_key`, but always as a tuple (child classes
+    # may have declared `_key` as a list, for instance). It's computed only once
+    # per subclass, as soon as it's created (see __pydantic_init_subclass__).
+    _key_fields: ClassVar[Tuple[str, ...]] = ()
+
+    # an optional tuple of strings with names of additional attributes of the model
+    # class that are frequently used in searches (e.g. `.filter()` or `.get()`) and
+    # should, therefore, be indexed in the data store. Fields named in `_key` are
+    # always indexed, so there's no need to repeat them here.
+    _indexed_fields: Tuple[str, ...] = ()
+
+    # memoized value of the `key` property, computed the first time it's needed.
+    # It's reset whenever a field is assigned to, as well as on copies and unpickled
+    # instances (see _reset_cached_state()).
+    _cached_key: Optional[Tuple] = None
+
+    # memoized value of __hash__(). It covers the values of all fields, so it's
+    # reset along with `_cached_key`. Notice neither of them can tell if a field
+    # value is mutated in place, which is why that's not supported.
+    _cached_hash: Optional[int] = None
+
     # the global data store doesn't allow for duplication, as it
     # implements a set. However, pydantic-serdes doesn't necessarily care if a
     # duplication happens.This attribute indicates if an exception should
@@ -76,23 +161,119 @@ class PydanticSerdesBaseModel(BaseModel):
         super().__init_subclass__(**kwargs)
         cls._subclasses.append(cls)
 
+        cls._onetomany_fields = frozenset(
+            field_name
+            for field_name, field_type in cls.__annotations__.items()
+            if getattr(field_type, "__origin__", None) is OneToMany
+        )
+
         # Ensure 'onetomany_validators' decorator will be applied to all subclasses
         onetomany_validators(cls)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """
+        Maps the directive of each subclass to it as soon as the class is created,
+        so that the config never has to look for model classes by itself.
+
+        Private attributes are only settled by pydantic once the class is fully
+        built, which is why this isn't done in __init_subclass__.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+
+        key = cls.__private_attributes__["_key"].get_default()
+
+        if key is not PydanticUndefined:
+            cls._key_fields = tuple(key)
+
+        directive = cls.__private_attributes__["_directive"].get_default()
+
+        if directive:
+            GLOBAL_CONFIGS._directive_to_model_mapping[directive] = cls
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in type(self).model_fields:
+            super().__setattr__(name, value)
+            return
+
+        # the position of a stored instance in its sorted set, as well as its key
+        # in the data store, depend on the values of its fields. So it's taken out
+        # of the store before the field changes, and saved again right after.
+        data_store = self.ds()
+        stored = data_store._discard(self)
+        old_value = self.__dict__.get(name)
+
+        try:
+            super().__setattr__(name, value)
+        except BaseException:
+            if stored:
+                data_store.save(self)
+            raise
+
+        self._reset_cached_state()
+
+        if not stored:
+            return
+
+        try:
+            data_store.save(self)
+        except ModelInstanceAlreadyExistsError:
+            # the new key clashes with the one of another stored instance
+            super().__setattr__(name, old_value)
+            self._reset_cached_state()
+            data_store.save(self)
+            raise
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        # hashes of str values aren't the same across interpreter runs
+        self._reset_cached_state()
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "PydanticSerdesBaseModel":
+        # BaseModel.model_copy() writes `update` straight to the copy's __dict__,
+        # bypassing __setattr__(), so whatever was memoized must be reset here.
+        copied = super().model_copy(update=update, deep=deep)
+        copied._reset_cached_state()
+        return copied
+
+    def _reset_cached_state(self) -> None:
+        """
+        Discards the memoized key and hash, so that they are computed again when
+        needed.
+        """
+        private_attrs = self.__pydantic_private__
+
+        if private_attrs is not None:
+            private_attrs["_cached_key"] = None
+            private_attrs["_cached_hash"] = None
+
     def __hash__(self):
-        return hash((type(self),) + tuple(self.__dict__.values()))
+        # hashing walks over all field values (including any nested HashableDict
+        # and OneToMany ones), so it's done only once per instance.
+        private_attrs = self.__pydantic_private__
+        cached_hash = private_attrs["_cached_hash"]
+
+        if cached_hash is None:
+            cached_hash = hash((type(self),) + tuple(self.__dict__.values()))
+            private_attrs["_cached_hash"] = cached_hash
+
+        return cached_hash
 
     def __lt__(self, other):
-        return self.key <= other.key
+        return self.key < other.key
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        # compares the very same values __hash__() is computed from, rather than
+        # serializing both instances to strings.
+        return type(self) is type(other) and self.__dict__ == other.__dict__
 
     @classmethod
     def _normalize_for_validations(cls, dict_args: Dict[str, Any]) -> Dict[str, Any]:
         """
         Attempts to convert all values of dict_args to OneToMany objects when:
-            1 - the value is an iterable object; AND
+            1 - the value is an iterable object (other than str or bytes); AND
             2 - if the key associated with the value matches a filed in the model class; AND
             3 - the type associated with the field is 'OneToMany'.
 
@@ -101,21 +282,25 @@ class PydanticSerdesBaseModel(BaseModel):
         developers should guarantee this themselves by assigning OneToMany objects to their
         OneToMany fields.
 
+        Only the fields in cls._onetomany_fields are looked at, and dict_args is only
+        copied if any of its values actually has to be converted.
+
         Returns:
             Dict[str, Any]: the converted dict.
         """
-        converted_dict = {}
+        converted_dict = dict_args
 
-        for key, value in dict_args.items():
-            if (
-                isinstance(value, Iterable)
-                and not isinstance(value, OneToMany)
-                and key in cls.__annotations__
-                and getattr(cls.__annotations__[key], "__origin__", None) is OneToMany
+        for key in cls._onetomany_fields.intersection(dict_args):
+            value = dict_args[key]
+
+            # strings and bytes are iterables too, but never meant to be split up
+            if isinstance(value, Iterable) and not isinstance(
+                value, (str, bytes, OneToMany)
             ):
-                value = OneToMany(value)
+                if converted_dict is dict_args:
+                    converted_dict = dict(dict_args)
 
-            converted_dict[key] = value
+                converted_dict[key] = OneToMany(value)
 
         return converted_dict
 
@@ -125,19 +310,32 @@ class PydanticSerdesBaseModel(BaseModel):
         Returns the value of the `_directive` attribute. This is used to
         identify the model class when parsing a file of supported format.
         """
-        return self._directive
+        # just like for .key, BaseModel.__getattr__ is bypassed here.
+        return self.__pydantic_private__["_directive"]
 
     @property
     def key(self) -> Tuple:
         """
         Returns a tuple containing the values associate with the fields (attributes)
         named in the `_key` attribute.
+
+        The tuple is only built the first time this property is accessed, since the
+        sorted set in the data store evaluates it on every comparison.
         """
-        return tuple([getattr(self, attr) for attr in self._key])
+        # private attrs are read straight from __pydantic_private__, sparing us
+        # the trip through BaseModel.__getattr__ on this hot path.
+        private_attrs = self.__pydantic_private__
+        cached_key = private_attrs["_cached_key"]
+
+        if cached_key is None:
+            cached_key = _get_key_getter(self._key_fields)(self)
+            private_attrs["_cached_key"] = cached_key
+
+        return cached_key
 
     @classmethod
     def create_from_loaded_data(
-        cls, data: Union[Dict[str, Any], List[Dict[str, Any]]]
+        cls, data: Union[Dict[str, Any], List[Dict[str, Any]]], validate: bool = True
     ) -> None:
         """Factory class method used to instantiate a model with data
         previously loaded and parsed from a file.
@@ -145,6 +343,10 @@ class PydanticSerdesBaseModel(BaseModel):
         Args:
             data (Union[Dict[str, Any], List[Dict[str, Any]]]): Data loaded
             from a file of supported format and parsed into a Dictionary or List.
+            validate (bool): If False, models are created without being validated
+            by pydantic. Only use it for data known to be valid already (e.g. data
+            previously dumped from models of this same class). See .create() for
+            more details. Defaults to True.
 
         Raises:
             PydanticSerdesTypeError: If `data` is not a dict nor a list.
@@ -154,16 +356,76 @@ class PydanticSerdesBaseModel(BaseModel):
                 f"Data passed to {cls.__name__} must be of type 'dict' or 'list', but was {type(data)}"
             )
 
+        # the 'validate' keyword is only passed along when needed, so that
+        # child classes overriding .create() aren't required to expect it.
+        create_kwargs = {} if validate else {"validate": False}
+
         if isinstance(data, list):
+            if cls._can_create_many():
+                cls._create_many(data, validate=validate)
+                return
+
             for _dict in data:
-                cls.create(dict_args=_dict)
+                cls.create(dict_args=_dict, **create_kwargs)
             return
 
-        cls.create(dict_args=data)
+        cls.create(dict_args=data, **create_kwargs)
+
+    @classmethod
+    def _can_create_many(cls) -> bool:
+        """
+        Tells if instances of this class can be created in bulk by ._create_many().
+        That's only the case if .create() isn't overridden any further down the class
+        hierarchy than ._create_many() is, as ._create_many() would otherwise skip
+        whatever custom logic a child class has put in its .create() method.
+        """
+        for klass in cls.__mro__:
+            if "_create_many" in klass.__dict__:
+                return "create" in klass.__dict__
+
+            if "create" in klass.__dict__:
+                return False
+
+        return False
+
+    @classmethod
+    def _create_many(
+        cls, data: List[Dict[str, Any]], validate: bool = True
+    ) -> List["PydanticSerdesBaseModel"]:
+        """
+        Creates an instance of this class for each dict in `data`, just like calling
+        .create() for each of them would. However, validation is done for all of them
+        at once, by a single call to a (cached) pydantic TypeAdapter for a list of this
+        class, so the loop over them runs inside pydantic-core.
+
+        Notice no instance is saved to the data store unless all dicts in `data` pass
+        validation.
+
+        Args:
+            data (List[Dict[str, Any]]): a list of dicts, each containing the data
+            to instantiate a model.
+            validate (bool): see .create(). Defaults to True.
+
+        Returns:
+            List[PydanticSerdesBaseModel]: the instances of the model created.
+        """
+        rows = [
+            cls._normalize_for_validations(convert_dict_to_hashabledict(dict_args))
+            for dict_args in data
+        ]
+
+        if validate:
+            new_obj_models = _get_list_adapter(cls).validate_python(rows, strict=True)
+        else:
+            new_obj_models = [cls.model_construct(**dict_args) for dict_args in rows]
+
+        cls.ds().save_many(new_obj_models)
+
+        return new_obj_models
 
     @classmethod
     def create(
-        cls, dict_args: Dict[Any, Any], *args, **kwargs
+        cls, dict_args: Dict[Any, Any], *args, validate: bool = True, **kwargs
     ) -> "PydanticSerdesBaseModel":
         """
         Factory class method used to instantiate a model with data
@@ -172,38 +434,80 @@ class PydanticSerdesBaseModel(BaseModel):
         Args:
             dict_args (Dict[Any, Any]): a dictionary containing the data to be used
             to instantiate the model.
+            validate (bool): If False, the model is instantiated through pydantic's
+            .model_construct(), which skips validation altogether (type checks, coercion
+            and OneToMany validators alike). This is way faster, but must only be used
+            for trusted data. Defaults to True.
 
         Returns:
             PydanticSerdesBaseModel: the instance of the model created.
         """
         dict_args = convert_dict_to_hashabledict(dict_args)
         dict_args = cls._normalize_for_validations(dict_args)
-        new_obj_model = cls.model_validate(dict_args, strict=True, *args, **kwargs)
+
+        if validate:
+            new_obj_model = cls.model_validate(dict_args, strict=True, *args, **kwargs)
+        else:
+            new_obj_model = cls.model_construct(**dict_args)
+
         new_obj_model.ds().save(new_obj_model)
 
         return new_obj_model
 
+    @classmethod
+    def create_unvalidated(
+        cls, dict_args: Dict[Any, Any], *args, **kwargs
+    ) -> "PydanticSerdesBaseModel":
+        """
+        Same as .create(validate=False). Only use it for trusted data, for
+        instance, when reloading data previously dumped from models of this class.
+
+        Args:
+            dict_args (Dict[Any, Any]): a dictionary containing the data to be used
+            to instantiate the model.
+
+        Returns:
+            PydanticSerdesBaseModel: the instance of the model created.
+        """
+        return cls.create(dict_args, *args, validate=False, **kwargs)
+
     @classmethod
     def ds(cls) -> ModelsGlobalStore:
         """Returns the global data store where all models are stored."""
         return cls._data_store
 
     @classmethod
-    def filter(cls, search_params: Dict[Any, Any]) -> PydanticSerdesSortedSet:
+    def filter(cls, search_params: Dict[Any, Any]) -> List["PydanticSerdesBaseModel"]:
         """
-        Returns a PydanticSerdesSortedSet containing all instances of this
-        class that match the search_params.
+        Returns a list containing all instances of this class that match
+        the search_params, in the same order they are sorted in the data store.
 
         Args:
             search_params (Dict[Any, Any]): a dictionary with the key being the
             attribute of the model and the value being the value to be searched for.
 
         Returns:
-            PydanticSerdesSortedSet: the PydanticSerdesSortedSet containing the records
+            List[PydanticSerdesBaseModel]: the list containing the records
             that match the search_params.
         """
         return cls.ds().filter(cls, search_params)
 
+    @classmethod
+    def filter_sorted(cls, search_params: Dict[Any, Any]) -> PydanticSerdesSortedSet:
+        """
+        Same as .filter(), but returns the matching instances in a new
+        PydanticSerdesSortedSet.
+
+        Args:
+            search_params (Dict[Any, Any]): a dictionary with the key being the
+            attribute of the model and the value being the value to be searched for.
+
+        Returns:
+            PydanticSerdesSortedSet: the PydanticSerdesSortedSet containing the records
+            that match the search_params.
+        """
+        return cls.ds().filter_sorted(cls, search_params)
+
     @classmethod
     def get(cls, search_params: Dict[Any, Any]) -> "PydanticSerdesBaseModel":
         """
@@ -237,14 +541,12 @@ class PydanticSerdesBaseModel(BaseModel):
     def get_subclasses_with_directive(cls):
         """
         Returns a list of all subclasses that have a `_directive` attribute set.
-        The .get_default() method is used here since sub_cls._directive is
-        inherently a pydantic ModelPrivateAttr.
+
+        Since subclasses register their directives in the config as soon as they
+        are created (see .__pydantic_init_subclass__()), there's no need to go
+        through all subclasses looking for them.
         """
-        return [
-            sub_cls
-            for sub_cls in cls.get_subclasses()
-            if sub_cls._directive.get_default()
-        ]
+        return list(GLOBAL_CONFIGS._directive_to_model_mapping.values())
 
 
 class PydanticSerdesRenderableModel(PydanticSerdesBaseModel):
@@ -279,6 +581,16 @@ class PydanticSerdesRenderableModel(PydanticSerdesBaseModel):
         cls._set_template(**dict_args)
         return super().create(dict_args, *args, **kwargs)
 
+    @classmethod
+    def _create_many(
+        cls, data: List[Dict[str, Any]], validate: bool = True
+    ) -> List["PydanticSerdesRenderableModel"]:
+        """Overrides the _create_many method to guarantee the _template_name attribute"""
+        for dict_args in data:
+            cls._set_template(**dict_args)
+
+        return super()._create_many(data, validate=validate)
+
     @classmethod
     def _set_template(cls, **kwargs):
         """
@@ -294,7 +606,7 @@ class PydanticSerdesRenderableModel(PydanticSerdesBaseModel):
                 cls._template_name = informed_template_name
 
             else:
-                split_cls_name = re.findall("[A-Z][^A-Z]*", cls.__name__)
+                split_cls_name = _CAMEL_RE.findall(cls.__name__)
 
                 if "Model" in split_cls_name:
                     split_cls_name.remove("Model")
@@ -324,27 +636,38 @@ class PydanticSerdesRenderableModel(PydanticSerdesBaseModel):
             str: the rendered string produced by the .render() method of the Template
             object.
         """
-        if extra_vars_dict:
-            _dict_to_render = dict(self)
-            _dict_to_render.update(extra_vars_dict)
+        # field values are taken straight from the instance __dict__ (jinja2 makes its
+        # own copy of the render context anyway), instead of iterating over the model.
+        if extra_vars_dict or self.__pydantic_extra__:
+            _dict_to_render = {
+                **self.__dict__,
+                **(self.__pydantic_extra__ or {}),
+                **(extra_vars_dict or {}),
+            }
             return self._get_template().render(_dict_to_render)
 
-        return self._get_template().render(dict(self))
+        return self._get_template().render(self.__dict__)
 
-    def _get_template(self) -> Template:
+    def _get_template(self) -> "Template":
         """
         Retrieves the template file to be used to render this RenderablePydanticSerdesModel.
         Currently, only Jinja2 templates are supported. Hence, the file is expected to
         have a '.j2' extension.
 
+        Templates are compiled only once and then cached, so any changes to a template file
+        made while the process is running won't be picked up.
+
         Raises:
             RenderableTemplateError: if a template file with expected name does not exist.
 
         Returns:
             Template: The template file as a jinja2.Template object.
         """
-        env = Environment(loader=FileSystemLoader(GLOBAL_CONFIGS.templates_dir))
+        from jinja2.exceptions import TemplateNotFound
+
         try:
-            return env.get_template(f"{self.template_name}.j2")
+            return _get_compiled_template(
+                GLOBAL_CONFIGS.templates_dir, self.template_name
+            )
         except TemplateNotFound as err:
             raise RenderableTemplateError(err.message)
@@ -1,6 +1,6 @@
 import importlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
 
 from pydantic_serdes.config import get_config
 from pydantic_serdes.exceptions import (PydanticSerdesImportError,
@@ -51,7 +51,7 @@ def check_support_by_extension(file_path: Path) -> bool:
         raise PydanticSerdesTypeError(
             f"{file_path.absolute()} does not exist or is not a file."
         )
-    return file_path.suffix.lstrip(".") in GLOBAL_CONFIGS.supported_formats
+    return file_path.suffix.lstrip(".") in GLOBAL_CONFIGS._supported_formats_set
 
 
 def load_file_to_dict(file_path: Union[str, Path]) -> dict:
@@ -78,14 +78,7 @@ def load_file_to_dict(file_path: Union[str, Path]) -> dict:
             f"Supported formats are {GLOBAL_CONFIGS.supported_formats}"
         )
 
-    try:
-        loader_function = getattr(
-            GLOBAL_CONFIGS.loaders_module, f"{file_path.suffix.lstrip('.')}_loader"
-        )
-    except AttributeError:
-        raise PydanticSerdesImportError(
-            f"Could not find a loader function with name {file_path.suffix.lstrip('.')}_loader"
-        )
+    loader_function = GLOBAL_CONFIGS.get_loader(file_path.suffix.lstrip("."))
     return loader_function(file_path)
 
 
@@ -128,12 +121,7 @@ def convert_src_file_to(
 
     loaded_dict = load_file_to_dict(src_file)
 
-    try:
-        dumper_function = getattr(GLOBAL_CONFIGS.dumpers_module, f"{dst_format}_dumper")
-    except AttributeError:
-        raise PydanticSerdesImportError(
-            f"Could not find a dumper function with name {dst_format}_dumper"
-        )
+    dumper_function = GLOBAL_CONFIGS.get_dumper(dst_format)
 
     if not save_to_file:
         dst_file = None
@@ -143,43 +131,44 @@ def convert_src_file_to(
     return dumper_function(loaded_dict, dst_file, *args, **kwargs)
 
 
-def convert_flat_dict_to_hashabledict(dict_obj: dict) -> Type[HashableDictType]:
+def _convert_value_to_hashable(value: Any) -> Any:
     """
-    Converts a flat dictionary to a HashableDict.
-    This function SHOULDN'T be used directly, but rather through
-    `convert_dict_to_hashabledict` which will handle the
-    conversion of nested dictionaries.
-
-    Args:
-        dict_obj (dict): the dictionary to be converted.
-
-    Returns:
-        Type[HashableDictType]: the converted dictionary as a HashableDict.
+    Converts `value` to a HashableDict if it's a dict. If it's a list, its elements
+    are converted instead. Any other value is returned as is.
     """
-    if not dict_obj:
-        return HashableDict()
+    if isinstance(value, dict):
+        return convert_dict_to_hashabledict(value)
 
-    if not isinstance(dict_obj, HashableDict):
-        dict_obj = HashableDict(dict_obj)
+    if isinstance(value, list):
+        return [_convert_value_to_hashable(element) for element in value]
 
-    return dict_obj
+    return value
 
 
 def convert_dict_to_hashabledict(dict_obj: dict) -> Type[HashableDictType]:
     """Converts a nested dictionary to a HashableDict.
 
+    The conversion is done bottom-up in a single pass, so each (nested) dictionary
+    is only ever copied once. Dictionaries nested inside lists are converted too.
+    The given `dict_obj` itself is never mutated.
+
     Args:
         dict_obj (dict): the dictionary to be converted.
 
     Returns:
         Type[HashableDictType]: the converted dictionary as a HashableDict.
     """
-    for k in dict_obj:
-        if isinstance(dict_obj[k], dict):
-            convert_dict_to_hashabledict(dict_obj[k])
-            dict_obj[k] = convert_flat_dict_to_hashabledict(dict_obj[k])
+    converted_dict = HashableDict(
+        (k, _convert_value_to_hashable(v)) for k, v in dict_obj.items()
+    )
 
-    return convert_flat_dict_to_hashabledict(dict_obj)
+    # if nothing had to be converted in a HashableDict, there's no need for a copy of it
+    if isinstance(dict_obj, HashableDict) and all(
+        converted_dict[k] is v for k, v in dict_obj.items()
+    ):
+        return dict_obj
+
+    return converted_dict
 
 
 def generate_from_dict(
@@ -195,14 +184,32 @@ def generate_from_dict(
         DataTypeError: If `loaded_dict` is not a dict.
 
     """
-    for key in loaded_dict:
-        model_cls = GLOBAL_CONFIGS.directive_to_model_mapping.get(key)
-        if model_cls:
-            if isinstance(loaded_dict[key], list):
-                for dict_element in loaded_dict[key]:
-                    generate_from_dict(dict_element)
-
-            model_cls.create_from_loaded_data(loaded_dict[key])
+    _generate_from_dict(loaded_dict, GLOBAL_CONFIGS.directive_to_model_mapping)
+
+
+def _generate_from_dict(
+    loaded_dict: dict, directive_to_model_mapping: Dict[str, Type]
+) -> None:
+    """
+    Does the actual work for generate_from_dict(), with the directive-to-model
+    mapping fetched only once and handed down through the recursion.
+
+    Models are created bottom-up: any directives nested in the elements of a list
+    are processed before the models for the list itself are created, so that the
+    latter can rely on the former already being in the data store.
+    """
+    for key, value in loaded_dict.items():
+        model_cls = directive_to_model_mapping.get(key)
+
+        if model_cls is None:
+            continue
+
+        if isinstance(value, list):
+            for dict_element in value:
+                if isinstance(dict_element, dict):
+                    _generate_from_dict(dict_element, directive_to_model_mapping)
+
+        model_cls.create_from_loaded_data(value)
 
 
 def generate_from_file(file_path: Union[str, Path]) -> None:
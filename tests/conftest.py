@@ -0,0 +1,14 @@
+import pytest
+
+from pydantic_serdes import GLOBAL_DATA_STORE
+
+
+@pytest.fixture(autouse=True, scope="module")
+def clear_data_store():
+    """
+    Every test module starts (and leaves) with an empty global data store, so that
+    models created by one module never leak into another's assertions.
+    """
+    GLOBAL_DATA_STORE.clear()
+    yield
+    GLOBAL_DATA_STORE.clear()
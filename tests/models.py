@@ -11,6 +11,7 @@ class ProductModel(PydanticSerdesBaseModel):
     _err_on_duplicate = (
         True  # if data leading to duplicates are present, should we error?
     )
+    _indexed_fields = ("category",)  # fields frequently used in searches
 
     prod_id: str
     name: str
@@ -33,7 +34,7 @@ class CustomerModel(PydanticSerdesRenderableModel):
         interests = list()
 
         for category in dict_args["flagged_interests"]:
-            interests += [prod for prod in ProductModel.filter({"category": category})]
+            interests.extend(ProductModel.filter({"category": category}))
 
         # even though `interestes` is a list object, pydantic_serdes will
         # take care of ultimately converting this to a OneToMany object.
@@ -0,0 +1,20 @@
+from pydantic_serdes.config import get_config
+
+
+def test_reset_cache_resolves_env_vars_again(monkeypatch):
+    config = get_config()
+
+    monkeypatch.setenv("TEMPLATES_DIR", "first_dir")
+    config.reset_cache()
+    assert config.templates_dir == "first_dir"
+
+    # configs are memoized, so changing the env var alone has no effect...
+    monkeypatch.setenv("TEMPLATES_DIR", "second_dir")
+    assert config.templates_dir == "first_dir"
+
+    # ...until the cache is reset.
+    config.reset_cache()
+    assert config.templates_dir == "second_dir"
+
+    monkeypatch.undo()
+    config.reset_cache()
@@ -0,0 +1,48 @@
+import copy
+import pickle
+
+import pytest
+
+from pydantic_serdes.custom_collections import HashableDict, OneToMany
+
+
+def test_hashabledict_hash_matches_equal_dicts():
+    assert hash(HashableDict(a=1, b=2)) == hash(HashableDict(b=2, a=1))
+
+
+def test_hashabledict_hash_follows_mutations():
+    hashable_dict = HashableDict(a=1)
+    hash(hashable_dict)
+
+    hashable_dict["b"] = 2
+    assert hash(hashable_dict) == hash(HashableDict(a=1, b=2))
+
+    hashable_dict.update(c=3)
+    assert hash(hashable_dict) == hash(HashableDict(a=1, b=2, c=3))
+
+    del hashable_dict["c"]
+    hashable_dict.pop("b")
+    assert hash(hashable_dict) == hash(HashableDict(a=1))
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_hashabledict_cached_hash_is_not_pickled(protocol):
+    hashable_dict = HashableDict(a=1)
+    hash(hashable_dict)
+
+    unpickled = pickle.loads(pickle.dumps(hashable_dict, protocol=protocol))
+
+    assert unpickled == hashable_dict
+    assert type(unpickled) is HashableDict
+    assert not hasattr(unpickled, "_hash")
+    assert not hasattr(copy.copy(hashable_dict), "_hash")
+
+
+def test_onetomany_rejects_mixed_types():
+    with pytest.raises(TypeError):
+        OneToMany([1, "2"])
+
+
+def test_onetomany_rejects_unhashable_items():
+    with pytest.raises(TypeError):
+        OneToMany([[1], [2]])
@@ -1,4 +1,4 @@
-import os
+import filecmp
 
 import pytest
 
@@ -18,16 +18,17 @@ def src_file():
     return "tests/mocked_data/customers.json"
 
 
-# Define a fixture for the destination files
+# Define a fixture for the destination formats and files
 @pytest.fixture(params=formats, ids=lambda x: f"dst_format_{x}")
-def dst_file(request):
-    return f"tests/mocked_data/_customers.{request.param}"
+def dst_format_and_file(request):
+    return request.param, f"tests/mocked_data/_customers.{request.param}"
 
 
-def test_format_conversion(src_file, dst_file):
+def test_format_conversion(src_file, dst_format_and_file):
+    dst_format, dst_file = dst_format_and_file
+
     if src_file != dst_file:
         # Convert the source file to the destination format
-        dst_format = os.path.splitext(dst_file)[1].lstrip(".")
         if dst_format == "ini":
             with pytest.raises(PydanticSerdesDumperError):
                 convert_src_file_to(
@@ -38,8 +39,10 @@ def test_format_conversion(src_file, dst_file):
                 src_file=src_file, dst_format=dst_format, dst_file=dst_file
             )
 
-            # Compare the created file with the expected file
-            with open(dst_file, "r") as f_created:
-                expected_file = f"tests/mocked_data/customers.{dst_format}"
-                with open(expected_file, "r") as f_expected:
-                    assert f_created.read() == f_expected.read()
+            # Compare the created file with the expected file. Their contents are
+            # only read when they differ, so that pytest can show the diff.
+            expected_file = f"tests/mocked_data/customers.{dst_format}"
+
+            if not filecmp.cmp(dst_file, expected_file, shallow=False):
+                with open(dst_file) as created, open(expected_file) as expected:
+                    assert created.read() == expected.read()
@@ -0,0 +1,406 @@
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_serdes import GLOBAL_DATA_STORE as data_store
+from pydantic_serdes.custom_collections import (HashableDict,
+                                                PydanticSerdesSortedSet)
+from pydantic_serdes.exceptions import ModelInstanceAlreadyExistsError
+from pydantic_serdes.models import PydanticSerdesBaseModel
+
+
+class _ItemModel(PydanticSerdesBaseModel):
+    _key = ("item_id",)
+    _indexed_fields = ("color",)
+    _err_on_duplicate = True
+
+    item_id: str
+    color: str
+    size: int
+
+
+@pytest.fixture(autouse=True)
+def clear_data_store():
+    data_store.clear()
+    yield
+    data_store.clear()
+
+
+def test_clear_removes_all_records():
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    data_store.clear()
+
+    assert data_store.records == {}
+    assert _ItemModel.filter({"color": "red"}) == []
+
+    # keys are cleared along with the records, so the same key can be saved again
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+
+def test_create_many_from_loaded_data_is_sorted_by_key():
+    _ItemModel.create_from_loaded_data(
+        [
+            {"item_id": "c", "color": "red", "size": 1},
+            {"item_id": "a", "color": "blue", "size": 2},
+            {"item_id": "b", "color": "red", "size": 3},
+        ]
+    )
+
+    assert [item.item_id for item in _ItemModel.get_all()] == ["a", "b", "c"]
+
+
+def test_create_many_saves_nothing_unless_all_dicts_are_valid():
+    with pytest.raises(ValidationError):
+        _ItemModel.create_from_loaded_data(
+            [
+                {"item_id": "a", "color": "red", "size": 1},
+                {"item_id": "b", "color": "red", "size": "not an int"},
+            ]
+        )
+
+    assert len(_ItemModel.get_all()) == 0
+
+
+def test_create_without_validation():
+    # model_construct() doesn't type check, so the str is kept as is
+    item = _ItemModel.create(
+        {"item_id": "a", "color": "red", "size": "1"}, validate=False
+    )
+    other_item = _ItemModel.create_unvalidated(
+        {"item_id": "b", "color": "red", "size": "2"}
+    )
+
+    assert item.size == "1"
+    assert other_item.size == "2"
+    assert list(_ItemModel.get_all()) == [item, other_item]
+
+
+def test_filter_sorted_returns_a_new_sorted_set():
+    _ItemModel.create({"item_id": "b", "color": "red", "size": 1})
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 2})
+    _ItemModel.create({"item_id": "c", "color": "blue", "size": 3})
+
+    matches = _ItemModel.filter_sorted({"color": "red"})
+
+    assert isinstance(matches, PydanticSerdesSortedSet)
+    assert matches is not _ItemModel.get_all()
+    assert [item.item_id for item in matches] == ["a", "b"]
+
+
+def test_key_declared_as_a_list():
+    class _ListKeyModel(PydanticSerdesBaseModel):
+        _key = ["item_id", "color"]
+        _err_on_duplicate = True
+
+        item_id: str
+        color: str
+
+    item = _ListKeyModel.create({"item_id": "a", "color": "red"})
+
+    assert _ListKeyModel._key_fields == ("item_id", "color")
+    assert item.key == ("a", "red")
+    assert _ListKeyModel.get({"item_id": "a", "color": "red"}) is item
+
+
+def test_hash_follows_field_values():
+    item = _ItemModel(item_id="a", color="red", size=1)
+    hash(item)
+
+    item.color = "blue"
+    assert hash(item) == hash(_ItemModel(item_id="a", color="blue", size=1))
+
+    copied = item.model_copy(update={"size": 2})
+    assert hash(copied) == hash(_ItemModel(item_id="a", color="blue", size=2))
+
+    unpickled = pickle.loads(pickle.dumps(item))
+    assert unpickled == item
+    assert hash(unpickled) == hash(item)
+
+
+def test_model_copy_with_an_updated_key():
+    item = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    copied = item.model_copy(update={"item_id": "b"})
+    assert copied.key == ("b",)
+
+    data_store.save(copied)
+    assert list(_ItemModel.get_all()) == [item, copied]
+
+
+def test_changing_the_key_of_a_stored_instance():
+    item_a = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+    item_b = _ItemModel.create({"item_id": "b", "color": "red", "size": 2})
+
+    item_a.item_id = "c"
+
+    assert item_a.key == ("c",)
+    assert list(_ItemModel.get_all()) == [item_b, item_a]
+
+    # the old key is free to be used again, while the new one is taken
+    _ItemModel.create({"item_id": "a", "color": "blue", "size": 3})
+
+    with pytest.raises(ModelInstanceAlreadyExistsError):
+        item_b.item_id = "c"
+
+    assert item_b.item_id == "b"
+    assert [item.item_id for item in _ItemModel.get_all()] == ["a", "b", "c"]
+
+
+def test_filter_by_indexed_fields():
+    item_a = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+    item_b = _ItemModel.create({"item_id": "b", "color": "red", "size": 2})
+    _ItemModel.create({"item_id": "c", "color": "blue", "size": 2})
+
+    indexes = data_store._indexes["_ItemModel"]
+    assert set(indexes) == {"item_id", "color"}
+    assert indexes["color"]["red"] == {item_a, item_b}
+
+    assert _ItemModel.filter({"color": "red"}) == [item_a, item_b]
+    assert _ItemModel.get({"item_id": "b"}) is item_b
+    assert _ItemModel.filter({"color": "green"}) == []
+
+
+def test_filter_intersects_the_indexes_of_many_fields():
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+    item_b = _ItemModel.create({"item_id": "b", "color": "red", "size": 2})
+    _ItemModel.create({"item_id": "c", "color": "blue", "size": 2})
+
+    assert _ItemModel.filter({"color": "red", "size": 2}) == [item_b]
+    assert _ItemModel.filter({"item_id": "a", "size": 2}) == []
+
+
+def test_filter_by_an_unhashable_value_falls_back_to_a_scan():
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    assert _ItemModel.filter({"color": ["red"]}) == []
+
+
+def test_index_is_lazily_built_and_kept_up_to_date():
+    item_a = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    assert "size" not in data_store._indexes["_ItemModel"]
+    assert _ItemModel.filter({"size": 1}) == [item_a]
+    assert "size" in data_store._indexes["_ItemModel"]
+
+    item_b = _ItemModel.create({"item_id": "b", "color": "blue", "size": 1})
+
+    assert _ItemModel.filter({"size": 1}) == [item_a, item_b]
+
+
+def test_save_many_indexes_all_instances():
+    items = [
+        _ItemModel(item_id="b", color="red", size=1),
+        _ItemModel(item_id="a", color="red", size=2),
+    ]
+
+    data_store.save_many(items)
+
+    assert list(_ItemModel.get_all()) == [items[1], items[0]]
+    assert _ItemModel.filter({"color": "red"}) == [items[1], items[0]]
+    assert _ItemModel.get({"item_id": "b"}) is items[0]
+
+
+def test_changing_an_indexed_field_of_a_stored_instance():
+    item_a = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+    item_b = _ItemModel.create({"item_id": "b", "color": "red", "size": 2})
+    _ItemModel.filter({"size": 1})
+
+    item_a.color = "blue"
+    item_a.size = 2
+
+    assert _ItemModel.filter({"color": "red"}) == [item_b]
+    assert _ItemModel.filter({"color": "blue"}) == [item_a]
+    assert _ItemModel.filter({"size": 2}) == [item_a, item_b]
+    assert _ItemModel.filter({"size": 1}) == []
+    assert "red" in data_store._indexes["_ItemModel"]["color"]
+    assert 1 not in data_store._indexes["_ItemModel"]["size"]
+
+
+def test_as_dict_honors_model_dump_overrides():
+    class _SecretItemModel(PydanticSerdesBaseModel):
+        _key = ("item_id",)
+
+        item_id: str
+        secret: str
+
+        def model_dump(self, **kwargs):
+            return super().model_dump(exclude={"secret"}, **kwargs)
+
+    _SecretItemModel.create({"item_id": "a", "secret": "shh"})
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    assert data_store.as_dict() == {
+        "_SecretItemModel": [{"item_id": "a"}],
+        "_ItemModel": [{"item_id": "a", "color": "red", "size": 1}],
+    }
+
+
+def test_iter_as_dict_dumps_every_record_through_its_model_dump_override():
+    class _UpperItemModel(PydanticSerdesBaseModel):
+        _key = ("item_id",)
+
+        item_id: str
+
+        def model_dump(self, **kwargs):
+            return {"item_id": self.item_id.upper()}
+
+    _UpperItemModel.create_from_loaded_data([{"item_id": "b"}, {"item_id": "a"}])
+
+    assert dict(data_store.iter_as_dict()) == {
+        "_UpperItemModel": [{"item_id": "A"}, {"item_id": "B"}]
+    }
+
+
+def test_duplicate_error_keeps_its_components_as_args():
+    _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+
+    with pytest.raises(ModelInstanceAlreadyExistsError) as exc_info:
+        _ItemModel.create({"item_id": "a", "color": "blue", "size": 2})
+
+    err = exc_info.value
+    assert err.args == (_ItemModel, ("item_id",), ("a",))
+    assert "_ItemModel: duplicates not allowed" in str(err)
+
+    unpickled = pickle.loads(pickle.dumps(err))
+    assert unpickled.args == err.args
+    assert str(unpickled) == str(err)
+
+
+class _SharedKeyItemModel(PydanticSerdesBaseModel):
+    _key = ("item_id",)
+    _indexed_fields = ("color",)
+
+    item_id: str
+    color: str
+    size: int
+
+
+def test_indexed_search_keeps_the_store_order_of_records_sharing_a_key():
+    for size in range(8):
+        _SharedKeyItemModel.create({"item_id": "a", "color": "red", "size": size})
+    _SharedKeyItemModel.create({"item_id": "b", "color": "blue", "size": 8})
+
+    matches = _SharedKeyItemModel.filter({"color": "red"})
+
+    assert [item.size for item in matches] == list(range(8))
+    assert matches == [
+        item for item in _SharedKeyItemModel.get_all() if item.color == "red"
+    ]
+
+
+class _TaggedItemModel(PydanticSerdesBaseModel):
+    _key = ("item_id",)
+    _indexed_fields = ("tags",)
+
+    item_id: str
+    tags: HashableDict
+
+
+def test_dict_fields_are_changed_by_assignment():
+    # field values are not mutated in place. A new value is assigned instead, and
+    # the memoized hash, the store and its indexes all follow.
+    item = _TaggedItemModel.create({"item_id": "a", "tags": HashableDict(a=1)})
+    hash(item)
+
+    item.tags = HashableDict(item.tags, b=2)
+
+    equal_item = _TaggedItemModel(item_id="a", tags=HashableDict(a=1, b=2))
+    assert item == equal_item
+    assert hash(item) == hash(equal_item)
+    assert item in _TaggedItemModel.get_all()
+    assert _TaggedItemModel.filter({"tags": HashableDict(a=1, b=2)}) == [item]
+    assert _TaggedItemModel.filter({"tags": HashableDict(a=1)}) == []
+
+
+def test_failed_save_leaves_no_key_behind():
+    with pytest.raises(TypeError):
+        _ItemModel.create(
+            {"item_id": "a", "color": ["not", "hashable"], "size": 1}, validate=False
+        )
+
+    item = _ItemModel.create({"item_id": "a", "color": "red", "size": 1})
+    assert list(_ItemModel.get_all()) == [item]
+
+
+def test_failed_save_many_leaves_no_key_behind():
+    with pytest.raises(TypeError):
+        _ItemModel.create_from_loaded_data(
+            [
+                {"item_id": "a", "color": "red", "size": 1},
+                {"item_id": "b", "color": ["not", "hashable"], "size": 2},
+            ],
+            validate=False,
+        )
+
+    # whatever preceded the failing instance is still saved
+    assert [item.item_id for item in _ItemModel.get_all()] == ["a"]
+
+    _ItemModel.create({"item_id": "b", "color": "red", "size": 2})
+    assert [item.item_id for item in _ItemModel.get_all()] == ["a", "b"]
+
+
+class _PrivateTagItemModel(PydanticSerdesBaseModel):
+    _key = ("item_id",)
+    _tag: str = "x"
+
+    item_id: str
+    tags: HashableDict
+
+    @property
+    def first_tag(self):
+        return next(iter(self.tags), None)
+
+
+def test_non_field_attributes_are_searched_by_a_scan():
+    item = _PrivateTagItemModel.create({"item_id": "a", "tags": HashableDict(a=1)})
+
+    assert _PrivateTagItemModel.filter({"_tag": "x"}) == [item]
+    assert _PrivateTagItemModel.filter({"first_tag": "a"}) == [item]
+
+    item._tag = "y"
+    item.tags = HashableDict(b=1)
+
+    assert _PrivateTagItemModel.filter({"_tag": "y"}) == [item]
+    assert _PrivateTagItemModel.filter({"_tag": "x"}) == []
+    assert _PrivateTagItemModel.filter({"first_tag": "b"}) == [item]
+
+    # no index is built for them, nor is it attempted again on every search
+    assert set(data_store._indexes["_PrivateTagItemModel"]) == {"item_id"}
+    assert data_store._unindexable["_PrivateTagItemModel"] == {"_tag", "first_tag"}
+
+
+_SHARED_KEYS_SCRIPT = """
+from pydantic_serdes.models import PydanticSerdesBaseModel
+
+
+class ItemModel(PydanticSerdesBaseModel):
+    _key = ("item_id",)
+
+    item_id: str
+    size: int
+
+
+ItemModel.create_from_loaded_data([{"item_id": "a", "size": i} for i in range(8)])
+print([item.size for item in ItemModel.get_all()])
+"""
+
+
+@pytest.mark.parametrize("hash_seed", ["1", "2"])
+def test_create_many_keeps_the_order_of_instances_sharing_a_key(hash_seed):
+    # the order must not depend on the hashes of the instances, so it's checked
+    # in separate interpreters, each with a hash seed of its own.
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    result = subprocess.run(
+        [sys.executable, "-c", _SHARED_KEYS_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == str(list(range(8)))
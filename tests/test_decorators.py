@@ -0,0 +1,34 @@
+import pytest
+
+from pydantic_serdes.custom_collections import OneToMany
+from pydantic_serdes.models import PydanticSerdesBaseModel
+
+
+class _FirstItemModel(PydanticSerdesBaseModel):
+    _key = ("name",)
+
+    name: str
+
+
+class _SecondItemModel(PydanticSerdesBaseModel):
+    _key = ("number",)
+
+    number: int
+
+
+class _TwoOneToManyFieldsModel(PydanticSerdesBaseModel):
+    _key = ("first_items",)
+
+    first_items: OneToMany[_FirstItemModel, ...]
+    second_items: OneToMany[_SecondItemModel, ...]
+
+
+def test_onetomany_validators_are_bound_to_their_own_field():
+    # model_validate() is used so no instance ends up in the global data store
+    with pytest.raises(TypeError, match="first_items"):
+        _TwoOneToManyFieldsModel.model_validate(
+            {
+                "first_items": OneToMany([_SecondItemModel(number=1)]),
+                "second_items": OneToMany([_SecondItemModel(number=1)]),
+            }
+        )
@@ -0,0 +1,81 @@
+import configparser
+import io
+import json
+
+import pytest
+
+from pydantic_serdes import dumpers
+from pydantic_serdes.config import get_config
+from pydantic_serdes.dumpers import ini_dumper, json_dumper
+from pydantic_serdes.exceptions import PydanticSerdesDumperError
+
+
+def _configparser_ini(data):
+    config = configparser.ConfigParser()
+    config.read_dict(data)
+
+    with io.StringIO() as stream:
+        config.write(stream)
+        return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"section": {"key": "value", "other": "other value"}},
+        {"first": {"Upper": "case"}, "second": {"number": 1, "flag": True}},
+        {"section": {"multiline": "first line\nsecond line"}},
+        {1: {"key": "value"}, "empty": {}},
+        # these can't be formatted directly, so a ConfigParser is used instead
+        {"section": {"percent": "100%%"}},
+        {"DEFAULT": {"key": "value"}, "section": {"other": "value"}},
+    ],
+)
+def test_ini_dumper_matches_configparser(data):
+    assert ini_dumper(data) == _configparser_ini(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {1: {"key": "value"}, "1": {"key": "value"}},
+        {"section": {"Key": "value", "key": "value"}},
+    ],
+)
+def test_ini_dumper_rejects_duplicates(data):
+    with pytest.raises(PydanticSerdesDumperError):
+        ini_dumper(data)
+
+
+@pytest.fixture
+def use_orjson(monkeypatch):
+    config = get_config()
+
+    monkeypatch.setenv("USE_ORJSON", "1")
+    config.reset_cache()
+    yield
+    monkeypatch.undo()
+    config.reset_cache()
+
+
+def test_json_dumper_uses_the_stdlib_by_default():
+    data = {"key": [1, "value"]}
+
+    assert json_dumper(data) == json.dumps(data)
+
+
+def test_json_dumper_with_orjson(use_orjson):
+    pytest.importorskip("orjson")
+
+    assert json_dumper({"key": [1, "value"]}) == '{"key":[1,"value"]}'
+
+    # orjson can't serialize integers beyond 64 bits, so the stdlib is used instead
+    data = {"big": 2**64}
+    assert json_dumper(data) == json.dumps(data)
+
+
+def test_json_dumper_without_orjson(monkeypatch, use_orjson):
+    monkeypatch.setattr(dumpers, "orjson", None)
+    data = {"key": [1, "value"]}
+
+    assert json_dumper(data, indent=2) == json.dumps(data, indent=2)
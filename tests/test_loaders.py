@@ -0,0 +1,64 @@
+import io
+import math
+
+import pytest
+import yaml
+
+from pydantic_serdes import loaders
+from pydantic_serdes.config import get_config
+
+
+@pytest.fixture
+def use_orjson(monkeypatch):
+    config = get_config()
+
+    monkeypatch.setenv("USE_ORJSON", "1")
+    config.reset_cache()
+    yield
+    monkeypatch.undo()
+    config.reset_cache()
+
+
+def test_json_loader_uses_the_stdlib_by_default():
+    # orjson would have parsed it as a float
+    data = b'{"big": 123456789012345678901234567890}'
+
+    assert loaders.json_loader(io.BytesIO(data)) == {
+        "big": 123456789012345678901234567890
+    }
+
+
+def test_json_loader_with_orjson(use_orjson):
+    pytest.importorskip("orjson")
+
+    assert loaders.json_loader(io.BytesIO(b'{"key": [1, "value"]}')) == {
+        "key": [1, "value"]
+    }
+
+    # orjson rejects NaN, so the stdlib json module is used instead
+    loaded = loaders.json_loader(io.BytesIO(b'{"key": NaN}'))
+    assert math.isnan(loaded["key"])
+
+
+def test_json_loader_without_orjson(monkeypatch, use_orjson):
+    monkeypatch.setattr(loaders, "orjson", None)
+
+    assert loaders.json_loader(io.StringIO('{"key": [1, "value"]}')) == {
+        "key": [1, "value"]
+    }
+
+
+def test_yaml_loader_loads_python_tuple_tags():
+    # tuples used to be dumped as such, before a safe dumper was used
+    data = b"customer:\n  interests: !!python/tuple\n  - books\n  - games\n"
+
+    assert loaders.yaml_loader(io.BytesIO(data)) == {
+        "customer": {"interests": ("books", "games")}
+    }
+
+
+def test_yaml_loader_is_safe():
+    data = b"!!python/object/apply:os.getcwd []\n"
+
+    with pytest.raises(yaml.constructor.ConstructorError):
+        loaders.yaml_loader(io.BytesIO(data))
@@ -2,22 +2,37 @@
 This module contains utility functions for test cases
 """
 
+from operator import itemgetter
+
+_get_category = itemgetter("category")
+
 
 def sort_lists_in_dict(d):
-    for k, v in d.items():
-        if isinstance(v, list):
-            v.sort()
+    # nested dicts are walked through an explicit stack rather than by recursion
+    stack = [d]
+
+    while stack:
+        for v in stack.pop().values():
+            if isinstance(v, list):
+                v.sort()
 
-        elif isinstance(v, dict):
-            sort_lists_in_dict(v)
+            elif isinstance(v, dict):
+                stack.append(v)
 
 
 def get_customer_model_records_for_assertion(customer_model_records):
     for customer_dict in customer_model_records:
-        customer_dict["flagged_interests"] = list(
-            {interest["category"] for interest in customer_dict["flagged_interests"]}
-        )
-        sort_lists_in_dict(customer_dict)
+        # flagged_interests is rewritten (already sorted) and every other list is
+        # sorted in the very same pass over the customer dict.
+        for k, v in customer_dict.items():
+            if k == "flagged_interests":
+                customer_dict[k] = sorted(set(map(_get_category, v)))
+
+            elif isinstance(v, list):
+                v.sort()
+
+            elif isinstance(v, dict):
+                sort_lists_in_dict(v)
 
     return customer_model_records
 